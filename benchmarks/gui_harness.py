@@ -0,0 +1,314 @@
+"""
+Scripted GUI performance harness.
+
+Builds the real SudokuWindow on a private virtual X server (Xvfb) and plays
+a fixed, seeded script against it: cell clicks, digit entry, comment-mode
+toggles with pencil marks, and New Game cycles through the actual buttons.
+Input goes in with event_generate, and each operation is timed until Tk
+has processed it and painted (root.update()). Every renderer runs in its
+own process, so their memory numbers do not mix.
+
+Along the way it samples RSS, the number of widgets, canvas items and Tcl
+commands, so objects leaked by games that recreate widgets show up as
+steady growth.
+
+    python -m benchmarks.gui_harness --games 200
+    python -m benchmarks.gui_harness --renderer widgets --output gui.json
+    python -m benchmarks.gui_harness --display :0   # watch it on a real screen
+
+Needs Xvfb (e.g. the xvfb package) unless --display is given.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from constants.settings import BOARD_RENDERERS, DIFFICULTY_LEVELS
+from utils.histogram import LatencyHistogram
+
+OPERATIONS = ('new_game', 'generate', 'click', 'move', 'comments_mode', 'note')
+
+
+def start_xvfb():
+    """Start Xvfb on a free display; returns (process, display name)."""
+    read_fd, write_fd = os.pipe()
+    try:
+        process = subprocess.Popen(
+            ['Xvfb', '-displayfd', str(write_fd), '-screen', '0', '1280x1024x24',
+             '-nolisten', 'tcp'],
+            pass_fds=(write_fd,), stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        os.close(read_fd)
+        raise RuntimeError("Xvfb not found; install it or pass --display") from None
+    finally:
+        os.close(write_fd)
+    # Xvfb writes the display number it picked once it accepts clients
+    with os.fdopen(read_fd) as f:
+        number = f.readline().strip()
+    if not number:
+        process.terminate()
+        raise RuntimeError("Xvfb did not start")
+    return process, f':{number}'
+
+
+def rss_bytes():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def tk_objects(root):
+    """Widgets, canvas items and Tcl commands currently alive under root."""
+    widgets = items = 0
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        widgets += 1
+        if widget.winfo_class() == 'Canvas':
+            items += len(widget.find_all())
+        stack.extend(widget.winfo_children())
+    commands = len(root.tk.splitlist(root.tk.call('info', 'commands')))
+    return {'widgets': widgets, 'canvas_items': items, 'tcl_commands': commands}
+
+
+def find_button(root, text):
+    # The visible ttk button with this label (difficulty or New Game)
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        if (widget.winfo_class() == 'TButton' and widget.cget('text') == text
+                and widget.winfo_ismapped()):
+            return widget
+        stack.extend(widget.winfo_children())
+    raise LookupError(f"No visible {text!r} button")
+
+
+class Session:
+    """One window, one renderer, driven by a seeded script."""
+
+    def __init__(self, seed, size, difficulty):
+        # Imported here: Tk needs DISPLAY to be set first
+        from game.generator import SudokuGenerator
+        from game.sudoku import SudokuGame
+        from gui.base_window import SudokuWindow
+
+        self.game = SudokuGame()
+        # Same puzzles on every run and for every renderer
+        self.game.generator = SudokuGenerator(seed=seed)
+        self.window = SudokuWindow(self.game)
+        self.root = self.window.root
+        self.window.board_size.set(size)
+        self.difficulty = difficulty
+        self.rng = random.Random(seed)
+        self.histograms = {op: LatencyHistogram() for op in OPERATIONS}
+        self.root.update()
+
+        generate = self.game.generator.generate_puzzle
+
+        def timed_generate(*args, **kwargs):
+            # Kept apart so new_game shows the GUI's share of a new game
+            start = time.perf_counter()
+            result = generate(*args, **kwargs)
+            self.histograms['generate'].add(time.perf_counter() - start)
+            return result
+
+        self.game.generator.generate_puzzle = timed_generate
+
+    def timed(self, op, action):
+        start = time.perf_counter()
+        action()
+        self.root.update()
+        self.histograms[op].add(time.perf_counter() - start)
+
+    @property
+    def grid(self):
+        return self.window.grid
+
+    def click(self, row, col):
+        grid = self.grid
+        if grid.renderer == 'canvas':
+            board = grid.board
+            offset = board.PAD + board.cell_size // 2
+            self.timed('click', lambda: board.event_generate(
+                '<Button-1>', x=offset + col * board.cell_size,
+                y=offset + row * board.cell_size))
+        else:
+            cell = grid.cells[(row, col)]
+            self.timed('click', lambda: cell.event_generate('<Button-1>', x=5, y=5))
+
+    def key(self, op, keysym):
+        frame = self.grid.frame
+        self.timed(op, lambda: frame.event_generate('<KeyPress>', keysym=keysym))
+
+    def keysym(self, digit):
+        symbol = self.grid.digits[digit - 1]
+        return symbol.lower() if symbol.isalpha() else symbol
+
+    def new_game(self):
+        if hasattr(self.window, 'grid'):
+            self.find_and_invoke('New Game')
+        self.find_and_invoke(self.difficulty)
+        self.grid.frame.focus_force()
+
+    def find_and_invoke(self, text):
+        button = find_button(self.root, text)
+        self.timed('new_game', button.invoke)
+
+    def play(self, moves):
+        """Click around, enter correct digits and pencil marks."""
+        game, rng = self.game, self.rng
+        size = game.size
+        comment_key = 'space' if self.grid.comment_key == 'Space' else 'c'
+        for _ in range(moves):
+            empty = [idx for idx in range(size * size) if not game.state.cells[idx]]
+            if not empty:
+                return
+            row, col = divmod(rng.choice(empty), size)
+            self.click(row, col)
+            if rng.random() < 0.3:
+                # Pencil in a couple of candidates, then leave comments mode
+                candidates = game.candidates(row, col)
+                self.key('comments_mode', comment_key)
+                for digit in rng.sample(candidates, min(2, len(candidates))):
+                    self.key('note', self.keysym(digit))
+                self.key('comments_mode', comment_key)
+            else:
+                self.key('move', self.keysym(game.solution[row, col]))
+
+    def close(self):
+        self.game.shutdown()
+        self.root.destroy()
+
+
+def run_session(games, moves, seed, size, difficulty, sample_every):
+    session = Session(seed, size, difficulty)
+    samples = []
+    try:
+        for n in range(games):
+            session.new_game()
+            session.play(moves)
+            if n % sample_every == 0 or n == games - 1:
+                sample = {'games': n + 1, 'rss': rss_bytes()}
+                sample.update(tk_objects(session.root))
+                samples.append(sample)
+    finally:
+        session.close()
+    return {
+        'operations': {op: h.summary() for op, h in session.histograms.items()
+                       if h.count},
+        'samples': samples,
+    }
+
+
+def growth(samples):
+    # After the first game, which builds the screen, nothing should grow
+    first, last = samples[0], samples[-1]
+    return {key: last[key] - first[key]
+            for key in ('rss', 'widgets', 'canvas_items', 'tcl_commands')}
+
+
+def run_child(args, renderer, display):
+    env = dict(os.environ, DISPLAY=display, SUDOKU_RENDERER=renderer)
+    command = [sys.executable, '-m', 'benchmarks.gui_harness', '--child',
+               '--games', str(args.games), '--moves', str(args.moves),
+               '--seed', str(args.seed), '--size', str(args.size),
+               '--difficulty', args.difficulty,
+               '--sample-every', str(args.sample_every)]
+    result = subprocess.run(command, env=env, stdout=subprocess.PIPE, check=True)
+    return json.loads(result.stdout)
+
+
+def format_ms(seconds):
+    return f"{seconds * 1000:.2f}"
+
+
+def print_report(results):
+    for renderer, result in results.items():
+        print(f"{renderer} renderer")
+        print(f"  {'operation':<15}{'count':>7}{'mean ms':>10}{'p50':>9}"
+              f"{'p95':>9}{'p99':>9}{'max':>9}")
+        for op, stats in result['operations'].items():
+            print(f"  {op:<15}{stats['count']:>7}{format_ms(stats['mean']):>10}"
+                  + ''.join(f"{format_ms(stats[key]):>9}"
+                            for key in ('p50', 'p95', 'p99', 'max')))
+        last = result['samples'][-1]
+        delta = result['growth']
+        print(f"  after {last['games']} games: RSS {last['rss'] / 2**20:.1f}MiB "
+              f"({delta['rss'] / 2**20:+.1f}), widgets {last['widgets']} "
+              f"({delta['widgets']:+d}), canvas items {last['canvas_items']} "
+              f"({delta['canvas_items']:+d}), Tcl commands "
+              f"{last['tcl_commands']} ({delta['tcl_commands']:+d})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Sudoku GUI.")
+    parser.add_argument('--renderer', action='append', choices=BOARD_RENDERERS,
+                        help="board renderer to run (default: all)")
+    parser.add_argument('--games', type=int, default=200,
+                        help="new games played per renderer")
+    parser.add_argument('--moves', type=int, default=20,
+                        help="cells played per game")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="seed for the puzzles and the script")
+    parser.add_argument('--size', type=int, default=9, help="board size")
+    parser.add_argument('--difficulty', choices=list(DIFFICULTY_LEVELS),
+                        default='Easy')
+    parser.add_argument('--sample-every', type=int, default=25, metavar='N',
+                        help="record memory and Tk object counts every N games")
+    parser.add_argument('--display',
+                        help="use this X display instead of starting Xvfb")
+    parser.add_argument('--output', help="write results JSON to this file")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        # One renderer in this process (picked by SUDOKU_RENDERER); the
+        # parent reads the result from stdout
+        result = run_session(args.games, args.moves, args.seed, args.size,
+                             args.difficulty, args.sample_every)
+        result['growth'] = growth(result['samples'])
+        json.dump(result, sys.stdout)
+        return 0
+
+    xvfb = None
+    display = args.display
+    if display is None:
+        try:
+            xvfb, display = start_xvfb()
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 2
+    try:
+        results = {renderer: run_child(args, renderer, display)
+                   for renderer in args.renderer or BOARD_RENDERERS}
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    print_report(results)
+    if args.output:
+        report = {
+            'meta': {
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+                'games': args.games,
+                'moves': args.moves,
+                'size': args.size,
+                'difficulty': args.difficulty,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Generator and solver benchmarks.
+
+Times SudokuGenerator.generate_puzzle per difficulty and every solver
+backend on the bundled corpora, records search node/backtrack counts and
+peak memory, and writes the results as JSON. Pass --baseline with an
+earlier results file to flag regressions.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from constants.settings import DIFFICULTY_LEVELS
+from game.backends import BACKENDS, get_backend
+from game.board import Board
+from game.generator import SudokuGenerator
+
+CORPORA_DIR = os.path.join(os.path.dirname(__file__), 'corpora')
+
+# Metrics where a larger value is worse; everything else is informational
+COMPARED_METRICS = ('mean', 'p95', 'nodes', 'peak_memory')
+
+
+def load_corpus(path):
+    """Read one puzzle per line (81 characters, 0 or . for empty); # starts a comment."""
+    grids = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            grids.append(Board.from_string(line[:81]))
+    return grids
+
+
+def available_corpora():
+    return {os.path.splitext(name)[0]: os.path.join(CORPORA_DIR, name)
+            for name in sorted(os.listdir(CORPORA_DIR)) if name.endswith('.txt')}
+
+
+def summarize(times):
+    times = sorted(times)
+    return {
+        'count': len(times),
+        'mean': sum(times) / len(times),
+        'p50': times[len(times) // 2],
+        'p95': times[min(len(times) - 1, int(len(times) * 0.95))],
+        'max': times[-1],
+    }
+
+
+def peak_memory(func, *args):
+    # Measured in a separate call: tracemalloc slows down the timed runs
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_generation(backend, count, seed=None):
+    generator = SudokuGenerator(backend, seed=seed)
+    results = {}
+    for difficulty in DIFFICULTY_LEVELS:
+        times = []
+        for _ in range(count):
+            start = time.perf_counter()
+            generator.generate_puzzle(difficulty)
+            times.append(time.perf_counter() - start)
+        stats = summarize(times)
+        stats['peak_memory'] = peak_memory(generator.generate_puzzle, difficulty)
+        results[f'generate/{backend}/{difficulty}'] = stats
+    return results
+
+
+def bench_solving(backend, corpora):
+    module = get_backend(backend)
+    results = {}
+    for name, path in corpora.items():
+        grids = load_corpus(path)
+        # Build any one-off structures (e.g. the DLX matrix) before timing
+        module.solve(grids[0])
+        times = []
+        counters = {'nodes': 0, 'backtracks': 0}
+        for grid in grids:
+            start = time.perf_counter()
+            if module.solve(grid, stats=counters) is None:
+                raise ValueError(f"{backend} failed to solve a puzzle in {path}")
+            times.append(time.perf_counter() - start)
+        stats = summarize(times)
+        stats.update(counters)
+        stats['peak_memory'] = peak_memory(
+            lambda: [module.solve(grid) for grid in grids])
+        results[f'solve/{backend}/{name}'] = stats
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Return (key, metric, old, new) for every metric that grew by more than
+    threshold (a fraction) relative to baseline.
+    """
+    regressions = []
+    for key, stats in results.items():
+        old_stats = baseline.get(key)
+        if old_stats is None:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = old_stats.get(metric), stats.get(metric)
+            if old is None or new is None or old <= 0:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append((key, metric, old, new))
+    return regressions
+
+
+def format_value(metric, value):
+    if metric in ('mean', 'p50', 'p95', 'max'):
+        return f"{value * 1000:.2f}ms"
+    if metric == 'peak_memory':
+        return f"{value / 1024:.0f}KiB"
+    return str(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Sudoku engine.")
+    parser.add_argument('--backend', action='append', choices=list(BACKENDS),
+                        help="solver backend to run (default: all)")
+    parser.add_argument('--generate', type=int, default=20, metavar='N',
+                        help="puzzles generated per difficulty (0 to skip)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="random seed, so runs generate the same puzzles")
+    parser.add_argument('--corpus', action='append',
+                        help="corpus name or path (default: all bundled corpora)")
+    parser.add_argument('--output', help="write results JSON to this file")
+    parser.add_argument('--baseline', help="results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed growth before a metric counts as a "
+                             "regression (default 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    backends = args.backend or list(BACKENDS)
+    bundled = available_corpora()
+    corpora = {}
+    for entry in args.corpus or bundled:
+        if entry in bundled:
+            corpora[entry] = bundled[entry]
+        else:
+            corpora[os.path.splitext(os.path.basename(entry))[0]] = entry
+
+    results = {}
+    for backend in backends:
+        if args.generate:
+            results.update(bench_generation(backend, args.generate, args.seed))
+        results.update(bench_solving(backend, corpora))
+
+    for key, stats in results.items():
+        shown = ', '.join(f"{metric} {format_value(metric, stats[metric])}"
+                          for metric in ('mean', 'p95', 'max', 'nodes', 'peak_memory')
+                          if metric in stats)
+        print(f"{key:<28} {shown}")
+
+    report = {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for key, metric, old, new in regressions:
+            print(f"REGRESSION {key} {metric}: "
+                  f"{format_value(metric, old)} -> {format_value(metric, new)}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
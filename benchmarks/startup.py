@@ -0,0 +1,139 @@
+"""
+Cold-start report.
+
+Launches the GUI's startup path (main.start_gui) in fresh interpreters
+under -X importtime and reports the time to the first frame, the whole
+process time, and the imports that cost the most. --budget turns it into
+a guard: the command exits non-zero when the median first frame takes
+longer. With --imports-only no display is needed; only the imports of the
+startup path are timed.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --budget 300
+    python -m benchmarks.startup --imports-only
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.gui_harness import start_xvfb
+
+# Run in the child: time from the first import to the difficulty screen
+# being drawn, without starting the main loop
+FIRST_FRAME = """
+import time
+start = time.perf_counter()
+import main
+window = main.start_gui()
+window.root.update()
+print(time.perf_counter() - start)
+window.game_logic.shutdown()
+window.root.destroy()
+"""
+
+IMPORTS_ONLY = """
+import time
+start = time.perf_counter()
+import main
+import gui.base_window
+import game.sudoku
+print(time.perf_counter() - start)
+"""
+
+
+def parse_importtime(stderr):
+    """(cumulative seconds, self seconds, module, depth) per -X importtime line."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((int(cumulative) / 1e6, int(own) / 1e6, name.strip(), depth))
+    return imports
+
+
+def run_once(snippet, env):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', snippet],
+                            env=env, capture_output=True, text=True, check=True)
+    process = time.perf_counter() - start
+    return float(result.stdout.strip().splitlines()[-1]), process, result.stderr
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report GUI cold-start time.")
+    parser.add_argument('--runs', type=int, default=5,
+                        help="fresh interpreters to start (the median is reported)")
+    parser.add_argument('--top', type=int, default=15,
+                        help="slowest imports to list")
+    parser.add_argument('--budget', type=float, metavar='MS',
+                        help="fail when the median first frame takes longer")
+    parser.add_argument('--imports-only', action='store_true',
+                        help="time the startup imports only; needs no display")
+    parser.add_argument('--display',
+                        help="use this X display instead of starting Xvfb")
+    parser.add_argument('--output', help="write results JSON to this file")
+    args = parser.parse_args(argv)
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    xvfb = None
+    if not args.imports_only:
+        display = args.display
+        if display is None:
+            try:
+                xvfb, display = start_xvfb()
+            except RuntimeError as e:
+                print(e, file=sys.stderr)
+                return 2
+        env['DISPLAY'] = display
+
+    snippet = IMPORTS_ONLY if args.imports_only else FIRST_FRAME
+    ready, process, imports = [], [], []
+    try:
+        for _ in range(args.runs):
+            seconds, total, stderr = run_once(snippet, env)
+            ready.append(seconds)
+            process.append(total)
+            imports = parse_importtime(stderr)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    label = 'imports' if args.imports_only else 'first frame'
+    median = statistics.median(ready)
+    print(f"{label}: median {median * 1000:.1f}ms, "
+          f"min {min(ready) * 1000:.1f}ms over {args.runs} runs")
+    print(f"whole process: median {statistics.median(process) * 1000:.1f}ms")
+    top_level = sum(cumulative for cumulative, _, _, depth in imports if depth == 0)
+    print(f"imports (last run): {top_level * 1000:.1f}ms in {len(imports)} modules")
+    slowest = sorted(imports, reverse=True)[:args.top]
+    print(f"  {'cumulative ms':>14}{'self ms':>10}  module")
+    for cumulative, own, name, depth in slowest:
+        print(f"  {cumulative * 1000:>14.1f}{own * 1000:>10.1f}  {'  ' * depth}{name}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'mode': label,
+                'runs': ready,
+                'process': process,
+                'imports': [{'module': name, 'cumulative': cumulative,
+                             'self': own} for cumulative, own, name, _ in slowest],
+            }, f, indent=2)
+
+    if args.budget is not None and median * 1000 > args.budget:
+        print(f"OVER BUDGET: {median * 1000:.1f}ms > {args.budget:.0f}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
 # Game settings and constants
+import os
+
 WINDOW_SIZE = "600x900"
 WINDOW_BG = "#f0f0f0"
 
@@ -16,10 +18,12 @@ COLORS = {
     'readonly_column': '#c3e6c3',  # Grayed green
     'readonly_box': '#e6c3d5',  # Grayed pink
     'readonly_selected': '#c3c3e6',  # Grayed blue
+    'hint': '#fff3b0',     # Light yellow for cells a hint refers to
     'toggle_active': '#4a90e2',  # Blue for active toggle
     'toggle_inactive': '#bdc3c7'  # Gray for inactive toggle
 }
 
+# Clues left in the puzzle; digging stops earlier if uniqueness requires it
 DIFFICULTY_LEVELS = {
     'Easy': 35,
     'Medium': 30,
@@ -31,3 +35,85 @@ ANIMATION_SETTINGS = {
     'steps': 10,
     'speed': 20
 }
+
+# Wrong entries allowed before the game is lost
+LIVES = 3
+
+# Ready puzzles kept per difficulty and worker processes refilling them
+PUZZLE_POOL_SIZE = 3
+PUZZLE_POOL_WORKERS = 2
+# Failed generations in a row after which a difficulty is no longer refilled
+PUZZLE_POOL_RETRIES = 3
+
+# Pre-built puzzle bank (see game/bank.py); generated on demand if missing
+PUZZLE_BANK_FILE = "puzzles.bank"
+
+# Generation retries until the grader agrees with the requested difficulty,
+# and the time each grading run may take (seconds) before counting as Expert
+GRADE_ATTEMPTS = 40
+GRADER_TIME_BUDGET = 0.05
+
+# Board sizes offered in the menu (the box size is the square root)
+BOARD_SIZES = (4, 9, 16, 25)
+DEFAULT_BOARD_SIZE = 9
+
+# Symbols for digits 1..25; boards larger than 9x9 continue with letters
+DIGIT_SYMBOLS = "123456789ABCDEFGHIJKLMNOP"
+
+# Boards larger than 9x9 stop digging after this many seconds, and each
+# uniqueness probe gives up (keeping its clue) after this many search nodes.
+# That keeps generation to about two seconds, but it also puts a floor under
+# the clue count well above the 9x9 shares in DIFFICULTY_LEVELS: 16x16 gets
+# down to about 95 clues and 25x25 to about 280-310 (Expert asks for 47 and
+# 116). Longer budgets or deeper probes do not get much lower
+LARGE_BOARD_TIME_BUDGET = 2.0
+PROBE_NODE_LIMIT = 50
+
+# Difficulties the menu offers per board size (all of them for sizes not
+# listed), for the reason above: on 16x16 Easy reaches its 111 clues and
+# Medium ends near the floor, so Hard and Expert would be Medium again; on
+# 25x25 every difficulty ends at the floor, so there is only one
+SIZE_DIFFICULTIES = {
+    16: ('Easy', 'Medium'),
+    25: ('Easy',),
+}
+
+# Seeded puzzles (daily challenges, shared seeds) kept in memory by
+# SudokuGenerator, keyed on seed, difficulty, size and mode
+PUZZLE_CACHE_SIZE = 128
+
+# Seeded generation cannot stop on the clock and stay reproducible, so on
+# boards larger than 9x9 it only probes this share of the cells instead.
+# 16x16 probes them all (about 1.5 seconds), or Easy and Medium would both
+# stop at the same count; 25x25 has a single difficulty anyway
+SEEDED_PROBE_FRACTION = {16: 1.0, 25: 0.55}
+
+# Hints are worked out on a background thread; the grid checks for the
+# answer every HINT_POLL_MS milliseconds, and answers are cached per board
+HINT_POLL_MS = 50
+HINT_CACHE_SIZE = 64
+
+# How the board is drawn: 'canvas' puts the whole board on one canvas,
+# 'widgets' uses a Canvas widget per cell. SUDOKU_RENDERER overrides it,
+# e.g. to compare the two
+BOARD_RENDERERS = ('canvas', 'widgets')
+BOARD_RENDERER = os.environ.get('SUDOKU_RENDERER', 'canvas')
+
+# All GUI animations advance together on one timer, at most ANIMATION_FPS
+# times a second
+ANIMATION_FPS = 60
+
+# Opt-in input latency measurement for the GUI: set SUDOKU_INSTRUMENT=1 to
+# time each key press and click until it is painted. F12 shows the live
+# percentiles, and they are written to LATENCY_FILE when the window closes
+INSTRUMENT = os.environ.get('SUDOKU_INSTRUMENT', '') not in ('', '0')
+LATENCY_FILE = os.environ.get('SUDOKU_LATENCY_FILE', 'latency.json')
+LATENCY_OVERLAY_MS = 500
+
+# Level of the GUI's log messages on stderr (DEBUG shows every mode change)
+LOG_LEVEL = os.environ.get('SUDOKU_LOG_LEVEL', 'WARNING')
+
+# The puzzle bank, the background pool and the game screen's modules are
+# loaded this long after the window opens, off the main thread, so they
+# do not delay the first frame
+WARM_UP_DELAY_MS = 200
@@ -0,0 +1,97 @@
+"""
+Solver backend selection.
+
+A backend is a module exposing solve(grid, rng=None, stats=None),
+count_solutions(grid, limit=2), iter_solutions(grid) and
+dig(solution, cells, remove_count, deadline=None, max_nodes=None).
+Grids may be any square size. Backends are imported on first use.
+"""
+import importlib
+import time
+
+BACKENDS = {
+    'bitmask': 'game.solver',
+    'dlx': 'game.dlx',
+}
+
+DEFAULT_BACKEND = 'bitmask'
+
+
+def get_backend(name=DEFAULT_BACKEND):
+    """
+    Return the backend module registered under name.
+    Raises ValueError for unknown names.
+    """
+    try:
+        module = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown solver backend {name!r}, expected one of "
+            f"{', '.join(BACKENDS)}") from None
+    return importlib.import_module(module)
+
+
+def compare_backends(grids, names=None):
+    """
+    Solve every grid with each backend and return per-backend timings as
+    {name: {'total': seconds, 'mean': seconds, 'max': seconds}}.
+    Raises ValueError if two backends disagree on a solution.
+    """
+    names = list(names or BACKENDS)
+    results = {}
+    reference = None
+    for name in names:
+        backend = get_backend(name)
+        # Build any one-off structures (e.g. the DLX matrix) before timing
+        backend.solve(grids[0])
+        times = []
+        solutions = []
+        for grid in grids:
+            start = time.perf_counter()
+            solutions.append(backend.solve(grid))
+            times.append(time.perf_counter() - start)
+        if reference is None:
+            reference = solutions
+        elif solutions != reference:
+            raise ValueError(f"Backend {name!r} disagrees with {names[0]!r}")
+        results[name] = {
+            'total': sum(times),
+            'mean': sum(times) / len(times),
+            'max': max(times),
+        }
+    return results
+
+
+def main():
+    import argparse
+    from .batch import read_puzzles
+    from .board import Board
+    from .generator import SudokuGenerator
+
+    parser = argparse.ArgumentParser(
+        description="Time the solver backends side by side.")
+    parser.add_argument('puzzles', nargs='?',
+                        help="file with one puzzle per line, # for comments "
+                             "(default: freshly generated puzzles)")
+    parser.add_argument('--count', type=int, default=50,
+                        help="puzzles per difficulty when generating")
+    args = parser.parse_args()
+
+    if args.puzzles:
+        grids = [Board.from_string(text) for text in read_puzzles(args.puzzles)]
+    else:
+        generator = SudokuGenerator()
+        grids = [generator.generate_puzzle(difficulty)[0]
+                 for difficulty in ('Easy', 'Medium', 'Hard', 'Expert')
+                 for _ in range(args.count)]
+
+    results = compare_backends(grids)
+    print(f"{len(grids)} puzzles")
+    print(f"{'backend':<10}{'total (s)':>12}{'mean (ms)':>12}{'max (ms)':>12}")
+    for name, stats in results.items():
+        print(f"{name:<10}{stats['total']:>12.3f}"
+              f"{stats['mean'] * 1000:>12.3f}{stats['max'] * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
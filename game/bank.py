@@ -0,0 +1,240 @@
+"""
+Memory-mapped binary puzzle bank.
+
+Layout (little endian):
+    header   magic, version, record size, difficulty count, CRC-32 of records
+    index    one entry per difficulty: name, byte offset, record count
+    records  81 bytes of puzzle followed by 81 bytes of solution, one byte
+             per cell (0 for empty), grouped by difficulty
+
+Records have a fixed width, so picking a puzzle is a single slice of the
+mapped file with nothing to parse.
+
+Build and check a bank with:
+    python -m game.bank build puzzles.bank --count 1000 --workers 4
+    python -m game.bank check puzzles.bank
+"""
+import mmap
+import os
+import random
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from constants.settings import DIFFICULTY_LEVELS
+from .board import Board
+
+MAGIC = b'SDKBANK\0'
+VERSION = 1
+CELLS = 81
+RECORD_SIZE = 2 * CELLS
+
+HEADER = struct.Struct('<8sHHHxxI')
+INDEX_ENTRY = struct.Struct('<16sQI4x')
+
+
+class BankError(Exception):
+    pass
+
+
+class PuzzleBank:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.index, self.checksum = self._read_index()
+        except (ValueError, struct.error, BankError) as e:
+            self.close()
+            raise BankError(f"{path}: {e}") from None
+        except BaseException:
+            self.close()
+            raise
+
+    @classmethod
+    def open(cls, path):
+        """
+        Open the bank at path, or return None if it is missing or unreadable.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, BankError):
+            return None
+
+    def _read_index(self):
+        magic, version, record_size, count, checksum = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise BankError("not a puzzle bank")
+        if version != VERSION or record_size != RECORD_SIZE:
+            raise BankError(f"unsupported bank version {version}")
+
+        index = {}
+        for i in range(count):
+            name, offset, records = INDEX_ENTRY.unpack_from(
+                self._map, HEADER.size + i * INDEX_ENTRY.size)
+            if offset + records * RECORD_SIZE > len(self._map):
+                raise BankError("index points past the end of the file")
+            index[name.rstrip(b'\0').decode('ascii')] = (offset, records)
+        return index, checksum
+
+    def __contains__(self, difficulty):
+        return self.count(difficulty) > 0
+
+    def count(self, difficulty):
+        return self.index.get(difficulty, (0, 0))[1]
+
+    def get(self, difficulty, i):
+        """Return record i of difficulty as (puzzle, solution) Boards."""
+        offset, records = self.index[difficulty]
+        if not 0 <= i < records:
+            raise IndexError(f"{difficulty} has {records} puzzles")
+        start = offset + i * RECORD_SIZE
+        return (Board(9, self._map[start:start + CELLS]),
+                Board(9, self._map[start + CELLS:start + RECORD_SIZE]))
+
+    def random(self, difficulty, rng=random):
+        """Return a random (puzzle, solution) pair for difficulty."""
+        return self.get(difficulty, rng.randrange(self.count(difficulty)))
+
+    def records(self):
+        """Return a memoryview over the whole record area."""
+        start = min((offset for offset, _ in self.index.values()),
+                    default=len(self._map))
+        return memoryview(self._map)[start:]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _generate_records(difficulty, count):
+    # Runs in a worker process
+    from .generator import SudokuGenerator
+    generator = SudokuGenerator()
+    return b''.join(puzzle.to_bytes() + solution.to_bytes()
+                    for puzzle, solution in
+                    (generator.generate_puzzle(difficulty) for _ in range(count)))
+
+
+def build_bank(path, counts, workers=None, chunk_size=50):
+    """
+    Generate counts[difficulty] puzzles per difficulty across worker
+    processes and write them to path. The file is written next to path
+    and moved into place once complete.
+    """
+    names = list(counts)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = {name: [executor.submit(_generate_records, name,
+                                         min(chunk_size, counts[name] - i))
+                         for i in range(0, counts[name], chunk_size)]
+                  for name in names}
+        data = {name: b''.join(f.result() for f in chunks[name])
+                for name in names}
+
+    offset = HEADER.size + len(names) * INDEX_ENTRY.size
+    checksum = 0
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for name in names:
+            checksum = zlib.crc32(data[name], checksum)
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE, len(names), checksum))
+        for name in names:
+            f.write(INDEX_ENTRY.pack(name.encode('ascii'), offset,
+                                     len(data[name]) // RECORD_SIZE))
+            offset += len(data[name])
+        for name in names:
+            f.write(data[name])
+    os.replace(tmp_path, path)
+
+
+def _is_complete(cells):
+    digits = set(range(1, 10))
+    for i in range(9):
+        br, bc = i // 3 * 3, i % 3 * 3
+        if (set(cells[i * 9:i * 9 + 9]) != digits or
+                set(cells[i::9]) != digits or
+                {cells[(br + k // 3) * 9 + bc + k % 3] for k in range(9)} != digits):
+            return False
+    return True
+
+
+def verify_bank(path, check_unique=False):
+    """
+    Check the bank at path and return a list of problems (empty if sound):
+    header and checksum, every solution is a valid grid and every clue
+    agrees with its solution. With check_unique, also confirm that each
+    puzzle has exactly one solution.
+    """
+    try:
+        bank = PuzzleBank(path)
+    except (OSError, BankError) as e:
+        return [str(e)]
+
+    problems = []
+    with bank:
+        records = bank.records()
+        if zlib.crc32(records) != bank.checksum:
+            problems.append("checksum mismatch")
+        if check_unique:
+            from .solver import count_solutions
+        for name, (offset, count) in bank.index.items():
+            for i in range(count):
+                start = offset + i * RECORD_SIZE
+                puzzle = bank._map[start:start + CELLS]
+                solution = bank._map[start + CELLS:start + RECORD_SIZE]
+                if not _is_complete(solution):
+                    problems.append(f"{name} #{i}: invalid solution")
+                elif any(p and p != s for p, s in zip(puzzle, solution)):
+                    problems.append(f"{name} #{i}: clue disagrees with solution")
+                elif check_unique and count_solutions(Board(9, puzzle), 2) != 1:
+                    problems.append(f"{name} #{i}: puzzle is not unique")
+        records.release()
+    return problems
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or check a puzzle bank.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="generate a new bank")
+    build.add_argument('path')
+    build.add_argument('--count', type=int, default=1000,
+                       help="puzzles per difficulty")
+    build.add_argument('--difficulty', action='append',
+                       choices=list(DIFFICULTY_LEVELS),
+                       help="difficulty to include (default: all)")
+    build.add_argument('--workers', type=int, default=None)
+
+    check = commands.add_parser('check', help="verify an existing bank")
+    check.add_argument('path')
+    check.add_argument('--unique', action='store_true',
+                       help="also re-check that every puzzle is unique")
+
+    args = parser.parse_args()
+    if args.command == 'build':
+        difficulties = args.difficulty or list(DIFFICULTY_LEVELS)
+        build_bank(args.path, {d: args.count for d in difficulties}, args.workers)
+        print(f"Wrote {args.count * len(difficulties)} puzzles to {args.path}")
+    else:
+        problems = verify_bank(args.path, args.unique)
+        for problem in problems:
+            print(problem)
+        if problems:
+            raise SystemExit(1)
+        print(f"{args.path}: OK")
+
+
+if __name__ == "__main__":
+    main()
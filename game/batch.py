@@ -0,0 +1,272 @@
+"""
+Headless batch generation and solving for puzzle packs.
+
+Work is split into chunks of puzzles that worker processes handle; results
+are written out as soon as they arrive and only a few chunks per worker are
+in flight at once, so memory stays flat however many puzzles go through.
+
+    python main.py generate --count 100000 --difficulty Hard --workers 8
+    python main.py generate --count 500 --format 81char --output easy.txt
+    python main.py solve pack.txt --workers 8 --output solutions.txt
+"""
+import json
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from constants.settings import DIFFICULTY_LEVELS
+from utils.histogram import LatencyHistogram
+from .backends import BACKENDS, DEFAULT_BACKEND, get_backend
+from .board import Board
+from .generator import SudokuGenerator
+
+FORMATS = ('ndjson', '81char')
+# Chunks submitted per worker before waiting for one to finish
+CHUNKS_PER_WORKER = 2
+
+
+def format_record(puzzle, solution, difficulty, fmt):
+    if fmt == '81char':
+        return puzzle.to_string()
+    return json.dumps({'difficulty': difficulty, 'size': puzzle.size,
+                       'puzzle': puzzle.to_string(),
+                       'solution': solution.to_string()},
+                      separators=(',', ':'))
+
+
+def _generate_chunk(difficulty, count, size, backend, fmt):
+    # Runs in a worker process; lines are formatted here so only short
+    # strings travel back to the parent
+    generator = SudokuGenerator(backend)
+    return [format_record(*generator.generate_puzzle(difficulty, size=size),
+                          difficulty, fmt)
+            for _ in range(count)]
+
+
+def _chunks(counts, chunk_size):
+    for difficulty, count in counts.items():
+        for start in range(0, count, chunk_size):
+            yield difficulty, min(chunk_size, count - start)
+
+
+def generate_lines(counts, size=9, workers=None, chunk_size=25,
+                   backend=DEFAULT_BACKEND, fmt='ndjson'):
+    """
+    Yield formatted puzzles, counts[difficulty] of each, in the order their
+    chunks finish. workers=1 generates in this process.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}")
+    chunks = _chunks(counts, chunk_size)
+    if workers == 1:
+        for difficulty, count in chunks:
+            yield from _generate_chunk(difficulty, count, size, backend, fmt)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        limit = workers * CHUNKS_PER_WORKER
+        pending = set()
+        while True:
+            for difficulty, count in chunks:
+                pending.add(executor.submit(_generate_chunk, difficulty, count,
+                                            size, backend, fmt))
+                if len(pending) >= limit:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        # Also reached when the consumer stops early (e.g. a closed pipe)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def add_generate_arguments(parser):
+    parser.add_argument('--count', type=int, default=100,
+                        help="puzzles per difficulty")
+    parser.add_argument('--difficulty', action='append',
+                        choices=list(DIFFICULTY_LEVELS),
+                        help="difficulty to generate (repeatable, default: all)")
+    parser.add_argument('--size', type=int, default=9, help="board size")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU, "
+                             "1 to generate in-process)")
+    parser.add_argument('--chunk-size', type=int, default=25,
+                        help="puzzles per work unit")
+    parser.add_argument('--backend', choices=list(BACKENDS),
+                        default=DEFAULT_BACKEND)
+    parser.add_argument('--format', choices=FORMATS, default='ndjson')
+    parser.add_argument('--output', help="write to this file instead of stdout")
+
+
+def run_generate(args):
+    difficulties = args.difficulty or list(DIFFICULTY_LEVELS)
+    counts = {d: args.count for d in difficulties}
+    out = open(args.output, 'w') if args.output else sys.stdout
+    start = time.perf_counter()
+    written = 0
+    try:
+        for line in generate_lines(counts, args.size, args.workers,
+                                   args.chunk_size, args.backend, args.format):
+            out.write(line + '\n')
+            written += 1
+        out.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); not an error. Point
+        # stdout at devnull so the interpreter's final flush stays quiet
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print(f"Generated {written} puzzles in {elapsed:.1f}s "
+          f"({written / elapsed if elapsed else 0:.1f}/s)", file=sys.stderr)
+    return 0
+
+
+def read_puzzles(path):
+    """
+    Lazily yield puzzle strings from path ('-' for stdin), one per line.
+    Blank lines and # comments are skipped, and ndjson lines from
+    "generate" contribute their puzzle field. Regular files are mapped
+    with mmap so lines are sliced out of the page cache.
+    """
+    if path == '-':
+        lines = (line.encode() for line in sys.stdin)
+        yield from _puzzle_lines(lines)
+        return
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _puzzle_lines(iter(mapped.readline, b''))
+
+
+def _puzzle_lines(lines):
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(b'#'):
+            continue
+        if line.startswith(b'{'):
+            yield json.loads(line)['puzzle']
+        else:
+            yield line.decode('ascii', 'replace')
+
+
+def _solve_chunk(puzzles, backend, check_unique):
+    # Runs in a worker process. Returns one output line per puzzle and the
+    # time each solve took
+    module = get_backend(backend)
+    lines, latencies = [], []
+    for text in puzzles:
+        start = time.perf_counter()
+        try:
+            grid = Board.from_string(text)
+        except ValueError:
+            lines.append('invalid')
+            latencies.append(time.perf_counter() - start)
+            continue
+        if check_unique and module.count_solutions(grid, 2) > 1:
+            solution, line = None, 'multiple'
+        else:
+            solution = module.solve(grid)
+            line = ('unsolvable' if solution is None
+                    else Board.from_rows(solution).to_string())
+        latencies.append(time.perf_counter() - start)
+        lines.append(line)
+    return lines, latencies
+
+
+def solve_lines(puzzles, workers=None, chunk_size=500,
+                backend=DEFAULT_BACKEND, check_unique=False):
+    """
+    Solve an iterable of puzzle strings, yielding (chunk of output lines,
+    chunk of latencies) in input order. At most CHUNKS_PER_WORKER chunks
+    per worker are read ahead of the one being written.
+    """
+    puzzles = iter(puzzles)
+    chunks = iter(lambda: list(islice(puzzles, chunk_size)), [])
+    if workers == 1:
+        for chunk in chunks:
+            yield _solve_chunk(chunk, backend, check_unique)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        window = deque()
+        for chunk in islice(chunks, workers * CHUNKS_PER_WORKER):
+            window.append(executor.submit(_solve_chunk, chunk, backend,
+                                          check_unique))
+        while window:
+            # Waiting on the oldest chunk keeps the output in input order;
+            # later chunks keep the workers busy meanwhile
+            result = window.popleft().result()
+            for chunk in islice(chunks, 1):
+                window.append(executor.submit(_solve_chunk, chunk, backend,
+                                              check_unique))
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def add_solve_arguments(parser):
+    parser.add_argument('input', help="puzzle file, one per line ('-' for stdin)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU, "
+                             "1 to solve in-process)")
+    parser.add_argument('--chunk-size', type=int, default=500,
+                        help="puzzles per work unit")
+    parser.add_argument('--backend', choices=list(BACKENDS),
+                        default=DEFAULT_BACKEND)
+    parser.add_argument('--unique', action='store_true',
+                        help="report 'multiple' for puzzles with more than "
+                             "one solution")
+    parser.add_argument('--output', help="write to this file instead of stdout")
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def run_solve(args):
+    out = open(args.output, 'w') if args.output else sys.stdout
+    histogram = LatencyHistogram()
+    failed = 0
+    start = time.perf_counter()
+    try:
+        for lines, latencies in solve_lines(read_puzzles(args.input),
+                                            args.workers, args.chunk_size,
+                                            args.backend, args.unique):
+            out.write('\n'.join(lines) + '\n')
+            histogram.update(latencies)
+            failed += sum(1 for line in lines
+                          if line in ('invalid', 'unsolvable', 'multiple'))
+        out.flush()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    stats = histogram.summary()
+    print(f"Solved {stats['count'] - failed} of {stats['count']} puzzles in "
+          f"{elapsed:.1f}s ({stats['count'] / elapsed if elapsed else 0:.0f}/s)",
+          file=sys.stderr)
+    print("Latency " + ', '.join(f"{key} {format_seconds(stats[key])}"
+                                 for key in ('mean', 'p50', 'p95', 'p99', 'max')),
+          file=sys.stderr)
+    return 1 if failed else 0
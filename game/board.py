@@ -0,0 +1,101 @@
+"""
+Compact board value type.
+
+A Board keeps its cells in one flat bytearray (one byte per cell, 0 for
+empty) instead of a list of row lists, so copying is a single bytes copy,
+a board can be hashed for use as a cache key, and the cells can be handed
+out as a memoryview without copying. Iterating a Board yields its rows, so
+it can be passed anywhere a list of rows is read (the solvers, the grader).
+"""
+from constants.settings import DIGIT_SYMBOLS
+
+
+class Board:
+    __slots__ = ('size', 'cells')
+
+    def __init__(self, size=9, cells=None):
+        self.size = size
+        if cells is None:
+            self.cells = bytearray(size * size)
+        else:
+            self.cells = bytearray(cells)
+            if len(self.cells) != size * size:
+                raise ValueError(f"{len(self.cells)} cells for a {size}x{size} board")
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a board from a square list of rows (0 for empty cells)."""
+        return cls(len(rows), bytes(value for row in rows for value in row))
+
+    @classmethod
+    def from_string(cls, text):
+        """
+        Parse one character per cell, row by row (0 or . for empty cells,
+        letters past 9). The board size is the square root of the length.
+        """
+        size = int(round(len(text) ** 0.5))
+        box = int(round(size ** 0.5))
+        if size * size != len(text) or box < 2 or box * box != size:
+            raise ValueError(f"{len(text)} cells is not a valid board")
+        try:
+            cells = bytes(0 if ch in '0.' else DIGIT_SYMBOLS.index(ch.upper()) + 1
+                          for ch in text)
+        except ValueError:
+            raise ValueError(f"Unexpected character in {text!r}") from None
+        if max(cells) > size:
+            raise ValueError(f"Digit out of range for a {size}x{size} board")
+        return cls(size, cells)
+
+    def copy(self):
+        return Board(self.size, self.cells)
+
+    def to_string(self):
+        return ''.join(DIGIT_SYMBOLS[value - 1] if value else '0'
+                       for value in self.cells)
+
+    def to_bytes(self):
+        return bytes(self.cells)
+
+    def to_rows(self):
+        size = self.size
+        return [list(self.cells[r * size:(r + 1) * size]) for r in range(size)]
+
+    def memoryview(self):
+        """The cells without copying; the view stays live as the board changes."""
+        return memoryview(self.cells)
+
+    def filled(self):
+        return self.size * self.size - self.cells.count(0)
+
+    def __getitem__(self, pos):
+        row, col = pos
+        return self.cells[row * self.size + col]
+
+    def __setitem__(self, pos, value):
+        row, col = pos
+        self.cells[row * self.size + col] = value
+
+    def __len__(self):
+        # Number of rows, like the list of rows a Board stands in for
+        return self.size
+
+    def __iter__(self):
+        view = memoryview(self.cells)
+        size = self.size
+        for r in range(size):
+            yield view[r * size:(r + 1) * size]
+
+    def __eq__(self, other):
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.size == other.size and self.cells == other.cells
+
+    def __hash__(self):
+        # Boards used as keys must not be changed afterwards
+        return hash((self.size, bytes(self.cells)))
+
+    def __str__(self):
+        return self.to_string()
+
+    def __repr__(self):
+        return f"Board.from_string({self.to_string()!r})"
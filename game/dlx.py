@@ -0,0 +1,274 @@
+"""
+Dancing Links (Algorithm X) exact-cover solver.
+
+Sudoku is an exact-cover problem with one candidate row per (cell, digit)
+(729 for 9x9) and four constraint columns per cell (324 for 9x9): every
+cell holds one digit and every row, column and box holds each digit once.
+The linked matrix is built once per board size; a solve
+selects the clue rows, searches, and then unlinks in reverse order so the
+matrix is back to its pristine state for the next call.
+
+A DLXSolver mutates its matrix while solving, so it must not be shared
+between threads.
+"""
+import time
+from itertools import islice
+
+from .solver import NodeBudgetExceeded, geometry
+
+
+class DLXSolver:
+    def __init__(self, size=9):
+        geo = self.geo = geometry(size)
+        cells = geo.cells
+        columns = 4 * cells
+        # Node 0 is the root, nodes 1..columns the column headers
+        self.L = list(range(-1, columns))
+        self.L[0] = columns
+        self.R = list(range(1, columns + 2))
+        self.R[columns] = 0
+        self.U = list(range(columns + 1))
+        self.D = list(range(columns + 1))
+        self.C = list(range(columns + 1))
+        self.S = [0] * (columns + 1)
+        self.ROW = [-1] * (columns + 1)
+        # First node of every candidate row, indexed by idx * size + digit - 1
+        self.row_nodes = []
+
+        for idx in range(cells):
+            r, c, b = geo.row_of[idx], geo.col_of[idx], geo.box_of[idx]
+            for d in range(size):
+                self._add_row(idx * size + d, (
+                    1 + idx,
+                    1 + cells + r * size + d,
+                    1 + 2 * cells + c * size + d,
+                    1 + 3 * cells + b * size + d,
+                ))
+
+    def _add_row(self, row_id, columns):
+        L, R, U, D, C = self.L, self.R, self.U, self.D, self.C
+        first = len(C)
+        self.row_nodes.append(first)
+        for k, col in enumerate(columns):
+            node = first + k
+            L.append(first + (k - 1) % len(columns))
+            R.append(first + (k + 1) % len(columns))
+            U.append(U[col])
+            D.append(col)
+            C.append(col)
+            self.ROW.append(row_id)
+            D[U[col]] = node
+            U[col] = node
+            self.S[col] += 1
+
+    def _cover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[col]] = R[col]
+        L[R[col]] = L[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[col]] = col
+        L[R[col]] = col
+
+    def _select(self, node):
+        # Cover every column of the row containing node
+        j = node
+        while True:
+            self._cover(self.C[j])
+            j = self.R[j]
+            if j == node:
+                break
+
+    def _deselect(self, node):
+        j = self.L[node]
+        while True:
+            self._uncover(self.C[j])
+            if j == node:
+                break
+            j = self.L[j]
+
+    def _is_available(self, node):
+        # A row can be selected only while all of its columns are uncovered
+        L, R, C = self.L, self.R, self.C
+        j = node
+        while True:
+            col = C[j]
+            if R[L[col]] != col:
+                return False
+            j = R[j]
+            if j == node:
+                return True
+
+    def iter_solutions(self, grid, rng=None, stats=None):
+        """
+        Yield every solution of a grid of this solver's size as a list of rows.
+        The matrix is restored even if the caller stops early. If stats is
+        a dict, its 'nodes' and 'backtracks' counters are incremented, and
+        NodeBudgetExceeded is raised once 'nodes' passes its 'max_nodes'.
+        """
+        size = self.geo.size
+        selected = []
+        try:
+            for r, row in enumerate(grid):
+                for c, value in enumerate(row):
+                    if value:
+                        node = self.row_nodes[(r * size + c) * size + value - 1]
+                        if not self._is_available(node):
+                            return
+                        self._select(node)
+                        selected.append(node)
+
+            cells = [0] * self.geo.cells
+            for node in selected:
+                idx, d = divmod(self.ROW[node], size)
+                cells[idx] = d + 1
+            for cells in self._search(cells, rng, stats):
+                yield [cells[r * size:(r + 1) * size] for r in range(size)]
+        finally:
+            for node in reversed(selected):
+                self._deselect(node)
+
+    def _search(self, cells, rng, stats):
+        R, D, S = self.R, self.D, self.S
+        if stats is not None:
+            stats['nodes'] = stats.get('nodes', 0) + 1
+            if stats['nodes'] > stats.get('max_nodes', stats['nodes']):
+                raise NodeBudgetExceeded
+        if R[0] == 0:
+            yield cells
+            return
+
+        # Branch on the column with the fewest remaining rows
+        col = best = R[0]
+        best_size = S[col]
+        while col != 0 and best_size > 1:
+            if S[col] < best_size:
+                best, best_size = col, S[col]
+            col = R[col]
+        if best_size == 0:
+            if stats is not None:
+                stats['backtracks'] = stats.get('backtracks', 0) + 1
+            return
+
+        self._cover(best)
+        try:
+            rows = []
+            i = D[best]
+            while i != best:
+                rows.append(i)
+                i = D[i]
+            if rng is not None:
+                rng.shuffle(rows)
+
+            size = self.geo.size
+            for node in rows:
+                idx, d = divmod(self.ROW[node], size)
+                cells[idx] = d + 1
+                j = self.R[node]
+                while j != node:
+                    self._cover(self.C[j])
+                    j = self.R[j]
+                try:
+                    yield from self._search(cells, rng, stats)
+                finally:
+                    j = self.L[node]
+                    while j != node:
+                        self._uncover(self.C[j])
+                        j = self.L[j]
+                    cells[idx] = 0
+        finally:
+            self._uncover(best)
+
+
+_solvers = {}
+
+
+def _get_solver(size):
+    # Each matrix is built on first use and then shared by every call
+    if size not in _solvers:
+        _solvers[size] = DLXSolver(size)
+    return _solvers[size]
+
+
+def iter_solutions(grid, rng=None, stats=None):
+    """Yield every solution of a square grid (0 for empty cells)."""
+    return _get_solver(len(grid)).iter_solutions(grid, rng, stats)
+
+
+def solve(grid, rng=None, stats=None):
+    """
+    Solve a square grid (0 for empty cells).
+    Returns the solved grid as a new list of rows, or None if unsolvable.
+    """
+    solutions = iter_solutions(grid, rng, stats)
+    try:
+        return next(solutions, None)
+    finally:
+        # Restore the shared matrix now rather than when the generator
+        # happens to be collected
+        solutions.close()
+
+
+def count_solutions(grid, limit=2, stats=None):
+    """
+    Count the solutions of a grid, stopping once limit is reached.
+    """
+    solutions = iter_solutions(grid, stats=stats)
+    try:
+        return sum(1 for _ in islice(solutions, limit))
+    finally:
+        solutions.close()
+
+
+def dig(solution, cells, remove_count, deadline=None, max_nodes=None):
+    """
+    Blank cells (flat indices, tried in order) of solution while the puzzle
+    keeps a single solution, stopping after remove_count removals or once
+    time.perf_counter() passes deadline. max_nodes bounds each uniqueness
+    probe beyond the nodes that fill the blanks on the way to the first
+    solution (Algorithm X places one digit per node and has no
+    propagation); a probe that runs out keeps its clue, like the bitmask
+    backend.
+    """
+    size = len(solution)
+    puzzle = [list(row) for row in solution]
+    removed = 0
+    for idx in cells:
+        if removed == remove_count:
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        r, c = divmod(idx, size)
+        value = puzzle[r][c]
+        puzzle[r][c] = 0
+        stats = None
+        if max_nodes is not None:
+            stats = {'nodes': 0, 'max_nodes': removed + 1 + max_nodes}
+        try:
+            unique = count_solutions(puzzle, 2, stats) == 1
+        except NodeBudgetExceeded:
+            unique = False
+        if unique:
+            removed += 1
+        else:
+            puzzle[r][c] = value
+    return puzzle
@@ -0,0 +1,284 @@
+"""
+Human-technique difficulty grader.
+
+A puzzle is solved the way a person would: the easiest technique that makes
+progress is applied, then the search restarts from the easiest one. The
+grade is the hardest technique that was needed. Puzzles that the listed
+techniques cannot finish (or that run out of time) grade as Expert.
+
+Candidates are kept as one bit mask per cell, like the solver, so any board
+size from game.solver.geometry works.
+"""
+import time
+from itertools import combinations
+
+from constants.settings import DIGIT_SYMBOLS
+from .solver import SolverState, mask_digits
+
+# Difficulty bucket for each technique rank
+GRADES = {1: 'Easy', 2: 'Medium', 3: 'Hard', 4: 'Expert'}
+DIFFICULTY_RANKS = {name: rank for rank, name in GRADES.items()}
+UNSOLVED_RANK = 5
+
+
+def cell_name(geo, idx):
+    return f"r{geo.row_of[idx] + 1}c{geo.col_of[idx] + 1}"
+
+
+def digit_name(digit):
+    # As the board shows it, so 10 and up read A, B, ... on large boards
+    return DIGIT_SYMBOLS[digit - 1]
+
+
+def unit_name(geo, u):
+    kind = ('row', 'column', 'box')[u // geo.size]
+    return f"{kind} {u % geo.size + 1}"
+
+
+class Step:
+    """One deduction: the cells it fills, the candidates it removes and why."""
+    __slots__ = ('technique', 'placements', 'eliminations', 'explanation')
+
+    def __init__(self, technique, explanation, placements=(), eliminations=()):
+        self.technique = technique
+        self.explanation = explanation
+        self.placements = list(placements)
+        self.eliminations = list(eliminations)
+
+    def __repr__(self):
+        return f"Step({self.technique!r}, {self.explanation!r})"
+
+
+class CandidateGrid:
+    __slots__ = ('geo', 'cells', 'cands')
+
+    def __init__(self, grid):
+        state = SolverState.from_grid(grid)
+        self.geo = state.geo
+        self.cells = state.cells
+        self.cands = [0 if state.cells[idx] else state.candidates(idx)
+                      for idx in range(self.geo.cells)]
+
+    def place(self, idx, digit):
+        bit = ~(1 << (digit - 1))
+        self.cells[idx] = digit
+        self.cands[idx] = 0
+        for peer in self.geo.peers[idx]:
+            self.cands[peer] &= bit
+
+    def eliminate(self, idx, digit):
+        self.cands[idx] &= ~(1 << (digit - 1))
+
+    def apply(self, step):
+        for idx, digit in step.placements:
+            self.place(idx, digit)
+        for idx, digit in step.eliminations:
+            self.eliminate(idx, digit)
+
+    def solved(self):
+        return all(self.cells)
+
+    def broken(self):
+        # An empty cell with no candidates left means the puzzle is invalid
+        return any(not c and not m for c, m in zip(self.cells, self.cands))
+
+
+def find_naked_single(grid):
+    for idx, cand in enumerate(grid.cands):
+        if cand and not cand & (cand - 1):
+            digit = cand.bit_length()
+            return Step('Naked single',
+                        f"Naked single: {cell_name(grid.geo, idx)} can only be {digit_name(digit)}",
+                        placements=[(idx, digit)])
+    return None
+
+
+def find_hidden_single(grid):
+    geo, cands = grid.geo, grid.cands
+    for u, unit in enumerate(geo.units):
+        once = twice = 0
+        for idx in unit:
+            twice |= once & cands[idx]
+            once |= cands[idx]
+        singles = once & ~twice
+        if singles:
+            bit = singles & -singles
+            idx = next(i for i in unit if cands[i] & bit)
+            digit = bit.bit_length()
+            return Step('Hidden single',
+                        f"Hidden single: {digit_name(digit)} in {unit_name(geo, u)} "
+                        f"can only go in {cell_name(geo, idx)}",
+                        placements=[(idx, digit)])
+    return None
+
+
+def find_locked_candidates(grid):
+    geo, cands = grid.geo, grid.cands
+    size = geo.size
+    for u, unit in enumerate(geo.units):
+        for d in range(size):
+            bit = 1 << d
+            places = [idx for idx in unit if cands[idx] & bit]
+            if len(places) < 2:
+                continue
+            if u >= 2 * size:
+                # Pointing: inside a box the digit is confined to one line
+                lines = []
+                if len({geo.row_of[i] for i in places}) == 1:
+                    lines.append(geo.row_of[places[0]])
+                if len({geo.col_of[i] for i in places}) == 1:
+                    lines.append(size + geo.col_of[places[0]])
+            else:
+                # Claiming: inside a line the digit is confined to one box
+                lines = []
+                if len({geo.box_of[i] for i in places}) == 1:
+                    lines.append(2 * size + geo.box_of[places[0]])
+            for target in lines:
+                removed = [(i, d + 1) for i in geo.units[target]
+                           if i not in places and cands[i] & bit]
+                if removed:
+                    return Step('Locked candidates',
+                                f"Locked candidates: {digit_name(d + 1)} in {unit_name(geo, u)} "
+                                f"is confined to {unit_name(geo, target)}, eliminating it "
+                                f"from {', '.join(cell_name(geo, i) for i, _ in removed)}",
+                                eliminations=removed)
+    return None
+
+
+def _find_naked_subset(grid, size, name):
+    geo, cands = grid.geo, grid.cands
+    for u, unit in enumerate(geo.units):
+        pool = [idx for idx in unit if cands[idx] and cands[idx].bit_count() <= size]
+        for group in combinations(pool, size):
+            union = 0
+            for idx in group:
+                union |= cands[idx]
+            if union.bit_count() != size:
+                continue
+            removed = [(i, d) for i in unit if i not in group
+                       for d in mask_digits(cands[i] & union)]
+            if removed:
+                digits = ''.join(digit_name(d) for d in mask_digits(union))
+                return Step(name,
+                            f"{name}: {', '.join(cell_name(geo, i) for i in group)} "
+                            f"hold {digits} in {unit_name(geo, u)}, eliminating "
+                            + ', '.join(f"{digit_name(d)} from {cell_name(geo, i)}"
+                                        for i, d in removed),
+                            eliminations=removed)
+    return None
+
+
+def _find_hidden_subset(grid, size, name):
+    geo, cands = grid.geo, grid.cands
+    for u, unit in enumerate(geo.units):
+        places = {}
+        for d in range(geo.size):
+            cells = [idx for idx in unit if cands[idx] & (1 << d)]
+            if 2 <= len(cells) <= size:
+                places[d] = cells
+        for digits in combinations(places, size):
+            cells = set()
+            for d in digits:
+                cells.update(places[d])
+            if len(cells) != size:
+                continue
+            keep = sum(1 << d for d in digits)
+            removed = [(i, d) for i in sorted(cells)
+                       for d in mask_digits(cands[i] & ~keep)]
+            if removed:
+                return Step(name,
+                            f"{name}: {''.join(digit_name(d + 1) for d in digits)} in "
+                            f"{unit_name(geo, u)} only fit in "
+                            f"{', '.join(cell_name(geo, i) for i in sorted(cells))}, eliminating "
+                            + ', '.join(f"{digit_name(d)} from {cell_name(geo, i)}"
+                                        for i, d in removed),
+                            eliminations=removed)
+    return None
+
+
+def _find_fish(grid, size, name):
+    geo, cands = grid.geo, grid.cands
+    for d in range(geo.size):
+        bit = 1 << d
+        for base_offset, cover_offset in ((0, geo.size), (geo.size, 0)):
+            # Base lines (rows, then columns) where the digit has 2..size spots
+            bases = {}
+            for line in range(geo.size):
+                unit = geo.units[base_offset + line]
+                spots = [k for k, idx in enumerate(unit) if cands[idx] & bit]
+                if 2 <= len(spots) <= size:
+                    bases[line] = spots
+            for lines in combinations(bases, size):
+                covers = set()
+                for line in lines:
+                    covers.update(bases[line])
+                if len(covers) != size:
+                    continue
+                removed = [(idx, d + 1) for cover in sorted(covers)
+                           for k, idx in enumerate(geo.units[cover_offset + cover])
+                           if k not in lines and cands[idx] & bit]
+                if removed:
+                    base_units = ', '.join(unit_name(geo, base_offset + line)
+                                           for line in lines)
+                    return Step(name,
+                                f"{name}: {digit_name(d + 1)} in {base_units} is confined to "
+                                f"{len(covers)} lines, eliminating it from "
+                                f"{', '.join(cell_name(geo, i) for i, _ in removed)}",
+                                eliminations=removed)
+    return None
+
+
+# (name, rank, finder), easiest first
+TECHNIQUES = [
+    ('Hidden single', 1, find_hidden_single),
+    ('Naked single', 2, find_naked_single),
+    ('Locked candidates', 3, find_locked_candidates),
+    ('Naked pair', 3, lambda g: _find_naked_subset(g, 2, 'Naked pair')),
+    ('Hidden pair', 3, lambda g: _find_hidden_subset(g, 2, 'Hidden pair')),
+    ('Naked triple', 3, lambda g: _find_naked_subset(g, 3, 'Naked triple')),
+    ('Hidden triple', 3, lambda g: _find_hidden_subset(g, 3, 'Hidden triple')),
+    ('X-Wing', 4, lambda g: _find_fish(g, 2, 'X-Wing')),
+    ('Swordfish', 4, lambda g: _find_fish(g, 3, 'Swordfish')),
+]
+
+
+def next_step(grid):
+    """
+    Return (Step, rank) for the easiest deduction available on a
+    CandidateGrid, or (None, None) if none of the techniques apply.
+    """
+    for _, rank, finder in TECHNIQUES:
+        step = finder(grid)
+        if step is not None:
+            return step, rank
+    return None, None
+
+
+def rate(puzzle, time_budget=None):
+    """
+    Solve puzzle with the human techniques and return the rank of the
+    hardest one needed (1-4), or UNSOLVED_RANK if they cannot finish it
+    or time_budget (seconds) runs out first.
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    grid = CandidateGrid(puzzle)
+    hardest = 1
+    while not grid.solved():
+        if deadline is not None and time.perf_counter() > deadline:
+            return UNSOLVED_RANK
+        step, rank = next_step(grid)
+        if step is None or grid.broken():
+            return UNSOLVED_RANK
+        hardest = max(hardest, rank)
+        grid.apply(step)
+    return hardest
+
+
+def grade(puzzle, time_budget=None):
+    """Return the difficulty bucket ('Easy' .. 'Expert') for puzzle."""
+    return GRADES[bucket(rate(puzzle, time_budget))]
+
+
+def bucket(rank):
+    """Map a technique rank (including UNSOLVED_RANK) to a GRADES key."""
+    return min(rank, max(GRADES))
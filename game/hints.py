@@ -0,0 +1,78 @@
+"""
+Background hint engine.
+
+A hint is the easiest human deduction available on the current board (see
+game.grader), worked out on a worker thread so the Tk main loop never waits
+for it. Answers are cached by board state, so asking again before the next
+move costs nothing.
+"""
+import threading
+from collections import OrderedDict
+
+from constants.settings import HINT_CACHE_SIZE
+from .grader import CandidateGrid, Step, cell_name, digit_name, next_step
+
+
+class HintEngine:
+    def __init__(self, cache_size=HINT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def request(self, board, solution):
+        """
+        Return a Future for the next Step on board (a Board).
+        The Future is already resolved when the board is in the cache.
+        """
+        # Imported on the first hint; concurrent.futures (and the logging
+        # it pulls in) is not needed to get the window on screen
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        key = board.to_bytes()
+        with self.lock:
+            step = self.cache.get(key)
+            if step is not None:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                future = Future()
+                future.set_result(step)
+                return future
+            self.misses += 1
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='hints')
+        return self.executor.submit(self._find, key, board, solution)
+
+    def _find(self, key, board, solution):
+        candidates = CandidateGrid(board)
+        step, _ = next_step(candidates)
+        if step is None:
+            step = _reveal(candidates, solution)
+        with self.lock:
+            self.cache[key] = step
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return step
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _reveal(candidates, solution):
+    # None of the techniques apply: give away the empty cell with the
+    # fewest candidates instead
+    geo = candidates.geo
+    empty = [idx for idx in range(geo.cells) if not candidates.cells[idx]]
+    if not empty:
+        return None
+    idx = min(empty, key=lambda i: candidates.cands[i].bit_count())
+    digit = solution.cells[idx]
+    return Step('Reveal',
+                f"No simple deduction found: {cell_name(geo, idx)} is {digit_name(digit)}",
+                placements=[(idx, digit)])
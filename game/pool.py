@@ -0,0 +1,114 @@
+import threading
+from collections import deque
+from functools import partial
+
+from constants.settings import (DIFFICULTY_LEVELS, PUZZLE_POOL_RETRIES,
+                                PUZZLE_POOL_SIZE, PUZZLE_POOL_WORKERS)
+from .backends import DEFAULT_BACKEND
+from .generator import SudokuGenerator
+
+
+def _generate(difficulty, backend):
+    # Runs in a worker process, so it has to be a module-level function
+    return SudokuGenerator(backend).generate_puzzle(difficulty)
+
+
+class PuzzlePool:
+    """
+    Keeps a small queue of ready puzzles per difficulty, refilled in the
+    background by a process pool so starting a game never waits on the
+    generator.
+    """
+
+    def __init__(self, difficulties=DIFFICULTY_LEVELS, size=PUZZLE_POOL_SIZE,
+                 workers=PUZZLE_POOL_WORKERS, backend=DEFAULT_BACKEND):
+        self.size = size
+        self.workers = workers
+        self.backend = backend
+        self.queues = {d: deque(maxlen=size) for d in difficulties}
+        self.pending = {d: 0 for d in difficulties}
+        self.failures = {d: 0 for d in difficulties}
+        # Re-entrant: a future that is already done runs its callback
+        # inside _refill while the lock is held
+        self.lock = threading.RLock()
+        self.executor = None
+        self.closed = False
+
+    def start(self):
+        """Start the worker processes and fill every queue."""
+        # Imported here: multiprocessing is slow to load and the GUI only
+        # starts the pool after its first frame
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # By then Tk is running with its X connection open, so workers come
+        # from a fork server rather than a fork of this process (platforms
+        # without one spawn fresh interpreters anyway)
+        context = None
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+
+        # Locked like shutdown, so the two never interleave
+        with self.lock:
+            if self.executor is None and not self.closed:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                    mp_context=context)
+                for difficulty in self.queues:
+                    self._refill(difficulty)
+
+    def get(self, difficulty):
+        """
+        Pop a ready (puzzle, solution) pair for difficulty and schedule a
+        replacement. Returns None if the queue is empty or unknown.
+        """
+        queue = self.queues.get(difficulty)
+        if queue is None:
+            return None
+        try:
+            item = queue.popleft()
+        except IndexError:
+            item = None
+        self._refill(difficulty)
+        return item
+
+    def shutdown(self):
+        """Stop the workers without waiting for queued generations."""
+        with self.lock:
+            self.closed = True
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _refill(self, difficulty):
+        with self.lock:
+            if self.executor is None or self.closed:
+                return
+            # Checked again after every submit: a future that is already
+            # done runs _on_done at once, and a failed one refills from there
+            while self._missing(difficulty) > 0:
+                future = self.executor.submit(_generate, difficulty, self.backend)
+                self.pending[difficulty] += 1
+                future.add_done_callback(partial(self._on_done, difficulty))
+
+    def _missing(self, difficulty):
+        if self.failures[difficulty] > PUZZLE_POOL_RETRIES:
+            # Given up on this difficulty until a generation succeeds
+            return 0
+        return self.size - len(self.queues[difficulty]) - self.pending[difficulty]
+
+    def _on_done(self, difficulty, future):
+        # Called from the executor's management thread
+        with self.lock:
+            self.pending[difficulty] -= 1
+            if self.closed or future.cancelled():
+                return
+            if future.exception() is not None:
+                # Generate a replacement, unless this difficulty keeps
+                # failing; then the gap stays and start_new_game falls back
+                # to generating synchronously
+                self.failures[difficulty] += 1
+                if self.failures[difficulty] <= PUZZLE_POOL_RETRIES:
+                    self._refill(difficulty)
+                return
+            self.failures[difficulty] = 0
+            self.queues[difficulty].append(future.result())
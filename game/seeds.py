@@ -0,0 +1,61 @@
+# Vetted seed puzzles for transform mode, as 81-character strings
+# (0 for empty cells). Every puzzle has exactly one solution and was
+# graded into its bucket by game.grader.
+SEEDS = {
+    'Easy': [
+        ('003290785010008060829006304000005400045803096230900007001000000604002908000307000',
+         '463291785517438269829576314198765423745823196236914857381649572674152938952387641'),
+        ('001500008800900137400000005000017803007300026060280000694720000030068000008409362',
+         '971536248856942137423871695249617853187395426365284719694723581532168974718459362'),
+        ('063005000405701030700004501002003000001472000000096800056027400209010673007609000',
+         '163985742425761938798234561672853194981472356534196827856327419249518673317649285'),
+        ('080500400000000800507000006002406100143705090600010005030004702420001983010832500',
+         '281563479364297851597148326952486137143725698678319245836954712425671983719832564'),
+        ('801720030000004108400308027000042000604073090000609013070000049000597000005401870',
+         '891725634327964158456318927539142786614873295782659413173286549248597361965431872'),
+        ('070501420001469700800200650500000270090700004720000065000654890900002040002030010',
+         '376581429251469783849273651514396278698725134723148965137654892965812347482937516'),
+    ],
+    'Medium': [
+        ('001000000000190002000052806000200080300080100800960305083540060005620000002008907',
+         '241876593658193742739452816517234689396785124824961375983547261175629438462318957'),
+        ('000000000000000700200061804490005003500902080007130050006200300900080100785310020',
+         '364827591851493762279561834498675213513942687627138459146259378932786145785314926'),
+        ('100020070700008000800004013300080402000000697002400080003500000086370004200840005',
+         '134925876765138249829764513397681452418253697652497381943512768586379124271846935'),
+        ('000038407705401000030007000008050000000900000020380060250000030901743500006805100',
+         '162538497795461382834297615678152943413976258529384761257619834981743526346825179'),
+        ('002034560000080900810050032070510000028090050100000007000070020200000403001302600',
+         '792134568536287914814659732379518246428796351165423897643875129257961483981342675'),
+        ('003010000000500013500320907210905000000080520730100004000634000080000009002807060',
+         '973416258824579613561328947218945376496783521735162894159634782687251439342897165'),
+    ],
+    'Hard': [
+        ('006058210090000007200000000800009500400501000070260901020700040000000095000010000',
+         '736458219598126437241937856812379564469581723375264981623795148187642395954813672'),
+        ('200000300009007140700100000003900705950000000060001020000600010300000070004020560',
+         '241896357639257148785143296413962785952784631867531924528679413396415872174328569'),
+        ('000320000800000009900400603509870100700000090000201004008010405070003000000000008',
+         '164329587853167249927458613549876132712534896386291754638912475475683921291745368'),
+        ('049000027003008500000000830200070650010604002000010080080000000002090000600001070',
+         '849365127163728549527149836294873651318654792756912483981437265472596318635281974'),
+        ('800009000000010000300620000041000070006307108000002640000003890000000300007450060',
+         '852739416679814532314625789241586973596347128783192645165273894428961357937458261'),
+        ('030000200001000040008010000000600010105870960004900020500000800009080000046209000',
+         '937546281251798346468312579793625418125874963684931725572163894319487652846259137'),
+    ],
+    'Expert': [
+        ('000000090003080160005900003380000400000009671000000000702510080000004000100000900',
+         '467153892923487165815962743381675429254839671679241538792516384538794216146328957'),
+        ('000000000800903040700600902080000604100037000090000500005000006004800370200000000',
+         '429785163861923745753641982587219634146537298392468517935174826614852379278396451'),
+        ('070000000103000070500000014259300400080209160006080000000034009060500003000060000',
+         '672143598143958276598627314259316487384279165716485932821734659467591823935862741'),
+        ('002000060000801500046009070200070100000910005070000009100000000008000200003726000',
+         '512437968739861542846259371295374186684912735371685429127548693468193257953726814'),
+        ('100064008007008000005002490000000900000980050502400000000700001014000009708000540',
+         '129564378647398215385172496871625934436987152592431687953746821214853769768219543'),
+        ('200000080510000003030815000050007030004000807300060050000000200400050000000039060',
+         '249376581518924673736815942952487136164593827387261459693748215471652398825139764'),
+    ],
+}
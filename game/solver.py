@@ -0,0 +1,345 @@
+"""
+Bitmask constraint-propagation solver.
+
+Row, column and box usage is kept as bit masks (bit d-1 set means digit d
+is used), so the candidates of a cell are a couple of OR/AND operations
+instead of list scans. Any square board size works (4x4, 9x9, 16x16, ...).
+Search applies naked and hidden singles until nothing changes, then
+branches on the cell with the fewest candidates.
+"""
+
+import time
+from functools import lru_cache
+
+
+class Geometry:
+    """Lookup tables for a size x size board with box x box boxes."""
+    __slots__ = ('size', 'box', 'cells', 'all_digits', 'row_of', 'col_of',
+                 'box_of', 'units', 'peers')
+
+    def __init__(self, size):
+        box = int(round(size ** 0.5))
+        if box < 2 or box * box != size:
+            raise ValueError(f"Board size must be a square of 2 or more, got {size}")
+        self.size = size
+        self.box = box
+        self.cells = size * size
+        self.all_digits = (1 << size) - 1
+
+        # Flat cell index -> row, column and box number
+        self.row_of = [i // size for i in range(self.cells)]
+        self.col_of = [i % size for i in range(self.cells)]
+        self.box_of = [(i // size) // box * box + (i % size) // box
+                       for i in range(self.cells)]
+
+        # Rows, then columns, then boxes
+        self.units = (
+            [[r * size + c for c in range(size)] for r in range(size)] +
+            [[r * size + c for r in range(size)] for c in range(size)] +
+            [[(b // box * box + k // box) * size + b % box * box + k % box
+              for k in range(size)] for b in range(size)]
+        )
+        self.peers = [
+            sorted({i for u in (self.row_of[idx], size + self.col_of[idx],
+                                2 * size + self.box_of[idx])
+                    for i in self.units[u]} - {idx})
+            for idx in range(self.cells)
+        ]
+
+
+@lru_cache(maxsize=None)
+def geometry(size):
+    return Geometry(size)
+
+
+# Tables for the classic 9x9 board
+_CLASSIC = geometry(9)
+SIZE = _CLASSIC.size
+BOX = _CLASSIC.box
+CELLS = _CLASSIC.cells
+ALL_DIGITS = _CLASSIC.all_digits
+ROW_OF = _CLASSIC.row_of
+COL_OF = _CLASSIC.col_of
+BOX_OF = _CLASSIC.box_of
+UNITS = _CLASSIC.units
+
+
+def mask_digits(mask):
+    """Return the digits whose bits are set in mask, in ascending order."""
+    digits = []
+    while mask:
+        low = mask & -mask
+        digits.append(low.bit_length())
+        mask ^= low
+    return digits
+
+
+class SolverState:
+    __slots__ = ('geo', 'cells', 'rows', 'cols', 'boxes')
+
+    def __init__(self, size=SIZE):
+        geo = self.geo = geometry(size)
+        self.cells = [0] * geo.cells
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.boxes = [0] * size
+
+    @classmethod
+    def from_grid(cls, grid):
+        """
+        Build a state from a square grid (0 for empty cells); the board size
+        is the number of rows. Raises ValueError if two clues clash.
+        """
+        size = len(grid)
+        state = cls(size)
+        for r, row in enumerate(grid):
+            for c, value in enumerate(row):
+                if value:
+                    idx = r * size + c
+                    if not state.candidates(idx) & (1 << (value - 1)):
+                        raise ValueError(
+                            f"Conflicting clue {value} at row {r}, column {c}")
+                    state.place(idx, value)
+        return state
+
+    def copy(self):
+        state = SolverState.__new__(SolverState)
+        state.geo = self.geo
+        state.cells = self.cells[:]
+        state.rows = self.rows[:]
+        state.cols = self.cols[:]
+        state.boxes = self.boxes[:]
+        return state
+
+    def candidates(self, idx):
+        geo = self.geo
+        return geo.all_digits & ~(self.rows[geo.row_of[idx]] |
+                                  self.cols[geo.col_of[idx]] |
+                                  self.boxes[geo.box_of[idx]])
+
+    def place(self, idx, digit):
+        geo = self.geo
+        bit = 1 << (digit - 1)
+        self.cells[idx] = digit
+        self.rows[geo.row_of[idx]] |= bit
+        self.cols[geo.col_of[idx]] |= bit
+        self.boxes[geo.box_of[idx]] |= bit
+
+    def remove(self, idx):
+        geo = self.geo
+        bit = ~(1 << (self.cells[idx] - 1))
+        self.cells[idx] = 0
+        self.rows[geo.row_of[idx]] &= bit
+        self.cols[geo.col_of[idx]] &= bit
+        self.boxes[geo.box_of[idx]] &= bit
+
+    def to_grid(self):
+        return _rows(self.cells, self.geo.size)
+
+    def propagate(self):
+        """
+        Fill naked and hidden singles until a fixed point is reached.
+        Returns None if the state turns out to be contradictory, otherwise
+        (index, candidate mask) of the empty cell with the fewest candidates,
+        or (None, 0) if the grid is full.
+        """
+        geo = self.geo
+        all_digits, row_of, col_of, box_of = (geo.all_digits, geo.row_of,
+                                              geo.col_of, geo.box_of)
+        cells = self.cells
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        while True:
+            progress = False
+            best, best_cand, best_count = None, 0, geo.size + 1
+
+            # Naked singles: a cell with exactly one candidate
+            for idx in range(geo.cells):
+                if cells[idx]:
+                    continue
+                cand = all_digits & ~(rows[row_of[idx]] | cols[col_of[idx]] |
+                                      boxes[box_of[idx]])
+                if not cand:
+                    return None
+                if not cand & (cand - 1):
+                    self.place(idx, cand.bit_length())
+                    progress = True
+                elif not progress:
+                    count = cand.bit_count()
+                    if count < best_count:
+                        best, best_cand, best_count = idx, cand, count
+            if progress:
+                continue
+
+            # Hidden singles: a digit with exactly one place left in a unit
+            for unit in geo.units:
+                once = twice = placed = 0
+                for idx in unit:
+                    if cells[idx]:
+                        placed |= 1 << (cells[idx] - 1)
+                        continue
+                    cand = all_digits & ~(rows[row_of[idx]] | cols[col_of[idx]] |
+                                          boxes[box_of[idx]])
+                    twice |= once & cand
+                    once |= cand
+                if (once | placed) != all_digits:
+                    return None
+                singles = once & ~twice & ~placed
+                if not singles:
+                    continue
+                for idx in unit:
+                    if cells[idx]:
+                        continue
+                    hit = self.candidates(idx) & singles
+                    if hit:
+                        if hit & (hit - 1):
+                            return None
+                        self.place(idx, hit.bit_length())
+                        singles &= ~hit
+                        progress = True
+
+            # Nothing changed since the naked-single sweep, so its
+            # minimum-remaining-values pick is still current
+            if not progress:
+                return best, best_cand
+
+
+def _rows(cells, size):
+    return [cells[r * size:(r + 1) * size] for r in range(size)]
+
+
+def search(state, limit=1, rng=None, stats=None):
+    """
+    Depth-first search from state, returning up to limit solved cell lists.
+    rng (anything with shuffle) randomises the order in which branch digits
+    are tried. If stats is a dict, its 'nodes' and 'backtracks' counters
+    are incremented.
+    """
+    found = []
+    _search(state.copy(), limit, rng, found, stats)
+    return found
+
+
+def _search(state, limit, rng, found, stats=None):
+    if stats is not None:
+        stats['nodes'] = stats.get('nodes', 0) + 1
+        if stats['nodes'] > stats.get('max_nodes', stats['nodes']):
+            raise NodeBudgetExceeded
+    choice = state.propagate()
+    if choice is None:
+        if stats is not None:
+            stats['backtracks'] = stats.get('backtracks', 0) + 1
+        return
+    idx, cand = choice
+    if idx is None:
+        found.append(state.cells)
+        return
+    digits = mask_digits(cand)
+    if rng is not None:
+        rng.shuffle(digits)
+    for digit in digits:
+        child = state.copy()
+        child.place(idx, digit)
+        _search(child, limit, rng, found, stats)
+        if len(found) >= limit:
+            return
+
+
+def solve(grid, rng=None, stats=None):
+    """
+    Solve a square grid (0 for empty cells).
+    Returns the solved grid as a new list of rows, or None if unsolvable.
+    """
+    try:
+        state = SolverState.from_grid(grid)
+    except ValueError:
+        return None
+    found = search(state, 1, rng, stats)
+    if not found:
+        return None
+    return _rows(found[0], state.geo.size)
+
+
+def iter_solutions(grid):
+    """Yield every solution of a square grid (0 for empty cells)."""
+    try:
+        state = SolverState.from_grid(grid)
+    except ValueError:
+        return
+    yield from _iter_search(state)
+
+
+def _iter_search(state):
+    choice = state.propagate()
+    if choice is None:
+        return
+    idx, cand = choice
+    if idx is None:
+        yield state.to_grid()
+        return
+    for digit in mask_digits(cand):
+        child = state.copy()
+        child.place(idx, digit)
+        yield from _iter_search(child)
+
+
+def count_solutions(grid, limit=2):
+    """
+    Count the solutions of a grid, stopping once limit is reached.
+    """
+    try:
+        state = SolverState.from_grid(grid)
+    except ValueError:
+        return 0
+    return len(search(state, limit))
+
+
+class NodeBudgetExceeded(Exception):
+    pass
+
+
+def has_alternative(state, idx, value, max_nodes=None):
+    """
+    Check whether the puzzle in state, with cell idx empty, has a solution
+    that does not put value at idx. When value comes from a known solution
+    this is the same as asking whether count_solutions would reach 2, but
+    it probes from the caller's state instead of rebuilding one per call.
+    If a probe needs more than max_nodes search nodes the answer is
+    assumed to be True, which errs on the side of keeping a clue.
+    """
+    stats = None if max_nodes is None else {'nodes': 0, 'max_nodes': max_nodes}
+    for digit in mask_digits(state.candidates(idx) & ~(1 << (value - 1))):
+        child = state.copy()
+        child.place(idx, digit)
+        found = []
+        try:
+            _search(child, 1, None, found, stats)
+        except NodeBudgetExceeded:
+            return True
+        if found:
+            return True
+    return False
+
+
+def dig(solution, cells, remove_count, deadline=None, max_nodes=None):
+    """
+    Blank cells (flat indices, tried in order) of solution while the puzzle
+    keeps a single solution, stopping after remove_count removals or once
+    time.perf_counter() passes deadline. max_nodes bounds each uniqueness
+    probe; a probe that runs out keeps its clue.
+    """
+    # The same state is updated in place, so each probe starts from the
+    # current clues instead of rebuilding the masks
+    state = SolverState.from_grid(solution)
+    removed = 0
+    for idx in cells:
+        if removed == remove_count:
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        value = state.cells[idx]
+        state.remove(idx)
+        if has_alternative(state, idx, value, max_nodes):
+            state.place(idx, value)
+        else:
+            removed += 1
+    return state.to_grid()
@@ -1,31 +1,300 @@
+from array import array
+
+from constants.settings import DEFAULT_BOARD_SIZE, LIVES
+from .board import Board
 from .generator import SudokuGenerator
+from .hints import HintEngine
+from .solver import SolverState, mask_digits
 from utils.timer import Timer
 from utils.storage import GameStorage
 
+# Each move log entry is two 16-bit words: the flat cell index, then the
+# flags below | old << 5 | new. Digits (at most 25) fit in 5 bits; a note
+# entry's old/new are the pencil-mark digit when it is shown, else 0.
+NOTE_FLAG = 0x8000
+# Entry belongs to the same action as the one logged before it (e.g. the
+# notes cleared by placing a digit), so undo/redo treat them as one step
+GROUP_FLAG = 0x4000
+
+
 class SudokuGame:
-    def __init__(self):
-        self.generator = SudokuGenerator()
+    def __init__(self, pool=None, bank=None):
+        self.generator = SudokuGenerator(bank=bank)
+        # Optional PuzzlePool with puzzles generated in the background
+        self.pool = pool
         self.timer = Timer()
         self.storage = GameStorage()
+        self.hints = HintEngine()
         
         self.solution = None
         self.puzzle = None
         self.current_difficulty = None
+        self.size = DEFAULT_BOARD_SIZE
+        self.seed = None
+        # Digits on the board as row/column/box masks, plus how many cells
+        # are filled, kept up to date move by move so the queries below
+        # never rescan the grid
+        self.state = None
+        self.filled = 0
+        self.lives = LIVES
+        # Pencil marks per cell as digit masks, like the board masks
+        self.notes = []
+        # Undo and redo stacks of packed entries (see NOTE_FLAG)
+        self.history = array('H')
+        self.redo_log = array('H')
+        # Cells (flat indices) whose notes the last accepted move cleared,
+        # so views can repaint just those
+        self.note_changes = []
         
-    def start_new_game(self, difficulty):
+    def start_new_game(self, difficulty, size=DEFAULT_BOARD_SIZE, seed=None):
+        # A seed (e.g. a daily challenge) always gives the same puzzle
         self.current_difficulty = difficulty
-        self.puzzle, self.solution = self.generator.generate_puzzle(difficulty)
+        self.size = size
+        self.seed = seed
+        # The pool only pre-generates random classic 9x9 boards
+        ready = None
+        if self.pool and size == 9 and seed is None:
+            ready = self.pool.get(difficulty)
+        if ready is None:
+            # Pool empty or disabled: generate on the spot
+            ready = self.generator.generate_puzzle(difficulty, size=size,
+                                                   seed=seed)
+        self.puzzle, self.solution = ready
+        self._reset_board(LIVES)
         self.timer.start()
         return self.puzzle  # Return the generated puzzle
         
+    def _reset_board(self, lives):
+        self.state = SolverState.from_grid(self.puzzle)
+        self.filled = self.puzzle.filled()
+        self.lives = lives
+        self.notes = [0] * self.state.geo.cells
+        self.history = array('H')
+        self.redo_log = array('H')
+        self.note_changes = []
+        
+    def resume(self):
+        """
+        Restore the saved game, replaying its move log so the board and
+        notes are exactly as they were. Returns the puzzle, or None if
+        there is no save.
+        """
+        data = self.storage.load_game()
+        if data is None:
+            return None
+        self.puzzle, self.solution = data['puzzle'], data['solution']
+        self.current_difficulty = data['difficulty']
+        self.size = data.get('size', self.puzzle.size)
+        self.seed = data.get('seed')
+        self._reset_board(data.get('lives', LIVES))
+        history = array('H', data.get('history', []))
+        for k in range(0, len(history), 2):
+            self._apply(history[k], history[k + 1], forward=True)
+        self.history = history
+        self.redo_log = array('H', data.get('redo', []))
+        self.timer.start(data.get('elapsed_time', 0))
+        return self.puzzle
+        
+    def save(self):
+        """Save an unfinished game for resume(); a finished one clears the save."""
+        if self.state is None:
+            # No game was played this session; keep any earlier save
+            return
+        if self.check_completion() or self.is_game_over():
+            self.storage.clear_save()
+        else:
+            self.storage.save_game(self)
+        
     def validate_move(self, row, col, value):
         if not value:
             return True
         try:
-            return int(value) == self.solution[row][col]
+            return int(value) == self.solution[row, col]
         except ValueError:
             return False
     
+    def make_move(self, row, col, value):
+        """
+        Enter value at (row, col). A correct value is placed and True is
+        returned; a wrong one costs a life and returns False. A cell that
+        is already filled is left alone and returns False without a cost.
+        """
+        if self.value_at(row, col):
+            return False
+        if not self.validate_move(row, col, value):
+            self.lives = max(0, self.lives - 1)
+            if self.is_game_over():
+                # A lost game can't be resumed, so don't offer the old save
+                self.storage.clear_save()
+            return False
+        idx = row * self.size + col
+        value = int(value)
+        self._record(idx, 0, value)
+        self.state.place(idx, value)
+        self.filled += 1
+        # The digit can no longer be a note anywhere it now sees, and the
+        # filled cell keeps no notes; logged with the move so undo brings
+        # them back
+        self.note_changes = []
+        bit = 1 << (value - 1)
+        for peer in self.state.geo.peers[idx]:
+            if self.notes[peer] & bit:
+                self._set_note(peer, value, False)
+                self.note_changes.append(peer)
+        for digit in mask_digits(self.notes[idx]):
+            self._set_note(idx, digit, False)
+        if self.check_completion():
+            self.timer.stop()
+            self.storage.clear_save()
+        return True
+        
+    def toggle_note(self, row, col, digit):
+        """Flip pencil mark digit at (row, col); returns whether it is now shown."""
+        idx = row * self.size + col
+        if self.state.cells[idx]:
+            return False
+        shown = not self.notes[idx] & (1 << (digit - 1))
+        self._set_note(idx, digit, shown, grouped=False)
+        return shown
+        
+    def notes_at(self, row, col):
+        """Pencil-mark digits at (row, col), in ascending order."""
+        return mask_digits(self.notes[row * self.size + col])
+        
+    def set_notes(self, masks):
+        """
+        Replace the notes of every empty cell with masks (one per cell) as
+        a single undoable step. Returns the flat indices that changed.
+        """
+        changed = []
+        grouped = False
+        for idx, mask in enumerate(masks):
+            if self.state.cells[idx]:
+                continue
+            diff = self.notes[idx] ^ mask
+            if not diff:
+                continue
+            for digit in mask_digits(diff):
+                self._set_note(idx, digit, bool(mask & (1 << (digit - 1))),
+                               grouped)
+                grouped = True
+            changed.append(idx)
+        return changed
+        
+    def clear_notes(self, row=None, col=None):
+        """Clear the notes of one cell, or of the whole board; see set_notes."""
+        masks = self.notes[:]
+        if row is None:
+            masks = [0] * len(masks)
+        else:
+            masks[row * self.size + col] = 0
+        return self.set_notes(masks)
+        
+    def undo(self):
+        """
+        Step back the last action (a move with the notes it cleared, or a
+        note change). Returns the flat indices of the cells it touched.
+        """
+        changed = []
+        history = self.history
+        while history:
+            word = history.pop()
+            idx = history.pop()
+            self._apply(idx, word, forward=False)
+            self.redo_log.append(idx)
+            self.redo_log.append(word)
+            changed.append(idx)
+            if not word & GROUP_FLAG:
+                break
+        return changed
+        
+    def redo(self):
+        """Replay the last undone action; returns the cells it touched."""
+        changed = []
+        redo_log = self.redo_log
+        while redo_log:
+            word = redo_log.pop()
+            idx = redo_log.pop()
+            self._apply(idx, word, forward=True)
+            self.history.append(idx)
+            self.history.append(word)
+            changed.append(idx)
+            if not redo_log or not redo_log[-1] & GROUP_FLAG:
+                break
+        return changed
+        
+    def _record(self, idx, old, new, note=False, grouped=False):
+        if not grouped:
+            # A new action forks the timeline, so nothing is left to redo
+            del self.redo_log[:]
+        flags = (NOTE_FLAG if note else 0) | (GROUP_FLAG if grouped else 0)
+        self.history.append(idx)
+        self.history.append(flags | old << 5 | new)
+        
+    def _set_note(self, idx, digit, shown, grouped=True):
+        self._record(idx, 0 if shown else digit, digit if shown else 0,
+                     note=True, grouped=grouped)
+        if shown:
+            self.notes[idx] |= 1 << (digit - 1)
+        else:
+            self.notes[idx] &= ~(1 << (digit - 1))
+        
+    def _apply(self, idx, word, forward):
+        # Set the cell (or note) to the entry's new value, or back to its
+        # old one when undoing
+        old, new = (word >> 5) & 0x1f, word & 0x1f
+        value = new if forward else old
+        if word & NOTE_FLAG:
+            bit = 1 << ((old or new) - 1)
+            if value:
+                self.notes[idx] |= bit
+            else:
+                self.notes[idx] &= ~bit
+        elif value:
+            self.state.place(idx, value)
+            self.filled += 1
+        else:
+            self.state.remove(idx)
+            self.filled -= 1
+        
+    def value_at(self, row, col):
+        """Digit at (row, col), or 0 if the cell is empty."""
+        return self.state.cells[row * self.size + col]
+        
+    def conflicts(self, row, col, value):
+        """Whether value already appears in the row, column or box of (row, col)."""
+        idx = row * self.size + col
+        return not self.state.candidates(idx) & (1 << (int(value) - 1))
+        
+    def candidate_mask(self, row, col):
+        """Bit d-1 set for every digit d that (row, col) could still hold."""
+        idx = row * self.size + col
+        if self.state.cells[idx]:
+            return 0
+        return self.state.candidates(idx)
+        
+    def candidate_masks(self):
+        """Candidate masks of every cell in one pass (0 for filled cells)."""
+        state = self.state
+        return [0 if value else state.candidates(idx)
+                for idx, value in enumerate(state.cells)]
+        
+    def candidates(self, row, col):
+        """Digits (row, col) could still hold, in ascending order."""
+        return mask_digits(self.candidate_mask(row, col))
+        
+    def request_hint(self):
+        """Future for the next logical Step on the current board."""
+        return self.hints.request(Board(self.size, self.state.cells), self.solution)
+        
+    def is_game_over(self):
+        return self.lives <= 0
+        
+    def shutdown(self):
+        if self.pool:
+            self.pool.shutdown()
+        self.hints.shutdown()
+        
     def check_completion(self):
-        # ... completion check logic ...
-        pass 
\ No newline at end of file
+        # Only correct digits are ever placed, so a full board is solved
+        return self.state is not None and self.filled == self.state.geo.cells
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Sudoku symmetry transforms.
+
+Relabelling digits, permuting bands and stacks, permuting rows within a
+band or columns within a stack, and transposing all map a valid grid to
+another valid grid. Applied to a puzzle and its solution together they
+keep the puzzle unique and leave its difficulty unchanged, since every
+deduction maps onto the transformed grid.
+"""
+import random
+
+from .board import Board
+
+
+def _block_order(rng, box):
+    # Shuffle the blocks (bands or stacks), then the lines inside each block
+    blocks = list(range(box))
+    rng.shuffle(blocks)
+    order = []
+    for block in blocks:
+        lines = [block * box + k for k in range(box)]
+        rng.shuffle(lines)
+        order.extend(lines)
+    return order
+
+
+def random_transform(rng=random, size=9):
+    """
+    Pick a random element of the symmetry group.
+    Returns (row_order, col_order, digits, transpose) where row_order and
+    col_order give the source line for each target line and digits maps
+    old digit -> new digit (digits[0] is 0 so empty cells stay empty).
+    """
+    box = int(round(size ** 0.5))
+    relabel = list(range(1, size + 1))
+    rng.shuffle(relabel)
+    return (_block_order(rng, box), _block_order(rng, box), [0] + relabel,
+            rng.random() < 0.5)
+
+
+def apply_transform(board, transform):
+    """Return a transformed copy of a Board."""
+    row_order, col_order, digits, transpose = transform
+    size, cells = board.size, board.cells
+    if transpose:
+        flat = bytes(digits[cells[src_c * size + src_r]]
+                     for src_r in row_order for src_c in col_order)
+    else:
+        flat = bytes(digits[cells[src_r * size + src_c]]
+                     for src_r in row_order for src_c in col_order)
+    return Board(size, flat)
+
+
+def transform_pair(puzzle, solution, rng=random):
+    """Apply one random symmetry to a puzzle and its solution."""
+    transform = random_transform(rng, solution.size)
+    return apply_transform(puzzle, transform), apply_transform(solution, transform)
@@ -0,0 +1,76 @@
+"""
+One frame clock for every animation in the window.
+
+Widgets register tweens with the clock instead of running their own
+after() chains, so however many animations are running there is a single
+timer per frame. Progress is worked out from the time since a tween
+started, so when the main loop is busy the clock skips the frames it
+missed instead of queueing them up.
+"""
+import time
+import tkinter as tk
+
+from constants.settings import ANIMATION_FPS
+
+
+class Tween:
+    def __init__(self, duration, update, done=None):
+        self.duration = duration  # seconds
+        self.update = update  # called with the progress, from 0 to 1
+        self.done = done
+        self.start = time.perf_counter()
+
+
+class AnimationClock:
+    def __init__(self, root, fps=ANIMATION_FPS):
+        self.root = root
+        self.interval = 1.0 / fps
+        self.tweens = []
+        self.pending = None  # after() id of the next frame
+
+    def animate(self, duration_ms, update, done=None):
+        """
+        Call update(progress) once per frame for duration_ms, ending with
+        progress 1.0, then done(). Returns the tween for cancel().
+        """
+        tween = Tween(duration_ms / 1000, update, done)
+        self.tweens.append(tween)
+        if self.pending is None:
+            self.pending = self.root.after_idle(self.tick)
+        return tween
+
+    def cancel(self, tween):
+        if tween in self.tweens:
+            self.tweens.remove(tween)
+
+    def tick(self):
+        self.pending = None
+        start = time.perf_counter()
+        for tween in list(self.tweens):
+            progress = min(1.0, (start - tween.start) / tween.duration
+                           if tween.duration else 1.0)
+            try:
+                tween.update(progress)
+            except tk.TclError:
+                # Its widget was destroyed mid-animation
+                self.tweens.remove(tween)
+                continue
+            if progress >= 1.0:
+                self.tweens.remove(tween)
+                if tween.done:
+                    tween.done()
+        if self.tweens:
+            # Wait out the rest of this frame; a frame that ran long is
+            # followed by the next one as soon as possible
+            spent = time.perf_counter() - start
+            delay = max(1, int((self.interval - spent) * 1000))
+            self.pending = self.root.after(delay, self.tick)
+
+
+def clock_for(widget):
+    """The animation clock of widget's window, created on first use."""
+    root = widget.nametowidget('.')
+    clock = getattr(root, 'animation_clock', None)
+    if clock is None:
+        clock = root.animation_clock = AnimationClock(root)
+    return clock
@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
-from constants.settings import WINDOW_SIZE, WINDOW_BG, DIFFICULTY_LEVELS
-from .grid import SudokuGrid
-from .controls import ControlPanel
+from constants.settings import (WINDOW_SIZE, WINDOW_BG, DIFFICULTY_LEVELS,
+                                BOARD_SIZES, DEFAULT_BOARD_SIZE, LATENCY_FILE,
+                                SIZE_DIFFICULTIES)
+from .instrumentation import LatencyOverlay, recorder
 
 
 class SudokuWindow:
@@ -13,13 +14,25 @@ class SudokuWindow:
         self.root.window = self
 
         self.game_logic = game_logic
+        self.board_size = tk.IntVar(value=DEFAULT_BOARD_SIZE)
         self.setup_window()
         self.setup_styles()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Latency overlay, only when instrumentation is switched on
+        if recorder.enabled:
+            self.latency_overlay = LatencyOverlay(self.root)
+            self.root.bind_all('<F12>', self.latency_overlay.toggle)
 
         # Create main container
         self.main_frame = tk.Frame(self.root, bg=WINDOW_BG)
         self.main_frame.pack(expand=True, fill='both', padx=20, pady=20)
 
+        # Both screens are built once and swapped with pack_forget; the
+        # game screen is created by the first game and reset for later ones
+        self.difficulty_frame = None
+        self.game_frame = None
+
         # Start with difficulty selection
         self.show_difficulty_selection()
 
@@ -39,13 +52,22 @@ class SudokuWindow:
                              font=('Helvetica', 10))
 
     def show_difficulty_selection(self):
-        # Clear main frame
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-
+        if self.game_frame is not None:
+            self.game_frame.pack_forget()
+        if self.difficulty_frame is None:
+            self.create_difficulty_selection()
+
+        # Offer to continue the game that was open when the window closed
+        if self.game_logic.storage.has_save():
+            self.resume_button.pack(pady=(20, 5))
+        else:
+            self.resume_button.pack_forget()
+        self.difficulty_frame.pack(expand=True)
+
+    def create_difficulty_selection(self):
         # Create difficulty buttons
-        difficulty_frame = tk.Frame(self.main_frame, bg=WINDOW_BG)
-        difficulty_frame.pack(expand=True)
+        self.difficulty_frame = tk.Frame(self.main_frame, bg=WINDOW_BG)
+        difficulty_frame = self.difficulty_frame
 
         tk.Label(
             difficulty_frame,
@@ -54,33 +76,122 @@ class SudokuWindow:
             bg=WINDOW_BG
         ).pack(pady=(0, 20))
 
+        # Board size choice, applied to whichever difficulty is picked
+        size_frame = tk.Frame(difficulty_frame, bg=WINDOW_BG)
+        size_frame.pack(pady=(0, 15))
+        for size in BOARD_SIZES:
+            ttk.Radiobutton(
+                size_frame,
+                text=f"{size}x{size}",
+                value=size,
+                variable=self.board_size
+            ).pack(side=tk.LEFT, padx=5)
+
+        # Only the difficulties the chosen size can produce are shown
+        buttons_frame = tk.Frame(difficulty_frame, bg=WINDOW_BG)
+        buttons_frame.pack()
+        self.difficulty_buttons = {}
         for difficulty in DIFFICULTY_LEVELS:
-            ttk.Button(
-                difficulty_frame,
+            self.difficulty_buttons[difficulty] = ttk.Button(
+                buttons_frame,
                 text=difficulty,
                 style='Rounded.TButton',
                 command=lambda d=difficulty: self.start_game(d)
-            ).pack(pady=5)
+            )
+        self.board_size.trace_add('write', self.update_difficulty_buttons)
+        self.update_difficulty_buttons()
 
-    def start_game(self, difficulty):
-        # Clear main frame
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        # Packed by show_difficulty_selection when there is a save
+        self.resume_button = ttk.Button(
+            difficulty_frame,
+            text="Resume Last Game",
+            style='Rounded.TButton',
+            command=self.resume_game
+        )
+
+    def update_difficulty_buttons(self, *args):
+        offered = SIZE_DIFFICULTIES.get(self.board_size.get(), DIFFICULTY_LEVELS)
+        # Repacked in menu order, so hiding one keeps the others in place
+        for button in self.difficulty_buttons.values():
+            button.pack_forget()
+        for difficulty, button in self.difficulty_buttons.items():
+            if difficulty in offered:
+                button.pack(pady=5)
 
+    def start_game(self, difficulty):
         # Start new game and generate puzzle
-        puzzle = self.game_logic.start_new_game(difficulty)
+        puzzle = self.game_logic.start_new_game(difficulty, self.board_size.get())
+        self.show_game(puzzle)
+        if self.grid.auto_candidates:
+            # The toggle stays on from the last game
+            self.grid.set_auto_candidates(True)
+
+    def resume_game(self):
+        puzzle = self.game_logic.resume()
+        if puzzle is None:
+            # Save file vanished or is unreadable
+            self.show_difficulty_selection()
+            return
+        self.show_game(puzzle)
+        self.grid.sync_with_game()
+
+    def show_game(self, puzzle):
+        self.difficulty_frame.pack_forget()
+        if self.game_frame is None:
+            self.game_frame = tk.Frame(self.main_frame, bg=WINDOW_BG)
+
+        if not hasattr(self, 'grid') or self.grid.size != self.game_logic.size:
+            self.create_grid()
+        else:
+            self.grid.reset()
+        self.grid.fill_grid(puzzle)
 
-        # Create the Sudoku grid with a fixed height to leave room for additional controls
-        self.grid = SudokuGrid(self.main_frame, self.game_logic)
-        self.grid.frame.config(height=600)  # Set fixed height for the board
+        if not hasattr(self, 'controls'):
+            from .controls import ControlPanel
+            # Create control panel (which now includes the highlight toggle)
+            self.controls = ControlPanel(self.game_frame, self.game_logic)
+            self.controls.frame.pack(fill='x', pady=(20, 0))
+
+        self.game_frame.pack(expand=True, fill='both')
+        self.grid.frame.focus_set()
+
+    def create_grid(self):
+        # The game screen's modules load with the first game, so they do
+        # not hold up the first frame
+        from .grid import SudokuGrid
+
+        # Only a new board size needs new cells; the toggles carry over
+        old = getattr(self, 'grid', None)
+        self.grid = SudokuGrid(self.game_frame, self.game_logic)
+        if old is not None:
+            for flag in ('show_row', 'show_column', 'show_box',
+                         'show_matching', 'auto_candidates'):
+                setattr(self.grid, flag, getattr(old, flag))
+            old.frame.destroy()
+
+        # Fixed height leaves room for the controls below the board
+        self.grid.frame.config(height=600)
         # Prevent frame auto-resizing to its content
         self.grid.frame.pack_propagate(False)
-        self.grid.frame.pack(fill='x', padx=10, pady=(10, 0))
-        self.grid.fill_grid(puzzle)
-
-        # Create control panel (which now includes the highlight toggle)
-        self.controls = ControlPanel(self.main_frame, self.game_logic)
-        self.controls.frame.pack(fill='x', pady=(20, 0))
+        if hasattr(self, 'controls'):
+            self.grid.frame.pack(fill='x', padx=10, pady=(10, 0),
+                                 before=self.controls.frame)
+            self.controls.set_comment_key(self.grid.comment_key)
+            self.controls.update_comments_indicator(False)
+        else:
+            self.grid.frame.pack(fill='x', padx=10, pady=(10, 0))
+
+    def on_close(self):
+        # Keep an unfinished game for next time, then stop background
+        # puzzle generation before tearing down Tk
+        self.game_logic.save()
+        self.game_logic.shutdown()
+        if recorder.enabled:
+            recorder.export(LATENCY_FILE)
+        self.root.destroy()
 
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.game_logic.shutdown()
@@ -1,8 +1,11 @@
+import logging
 import tkinter as tk
 from tkinter import ttk
 from constants.settings import COLORS
 from gui.widgets.toggle_button import RoundToggleButton
 
+log = logging.getLogger(__name__)
+
 
 class ControlPanel:
     def __init__(self, parent, game_logic):
@@ -54,6 +57,15 @@ class ControlPanel:
             match_toggle_frame, command=self.toggle_match_highlight)
         self.match_toggle.pack(side=tk.TOP, pady=2)
 
+        # Auto Candidates Toggle (fills comments from the board, off by default)
+        candidates_toggle_frame = tk.Frame(highlight_toggles_frame)
+        candidates_toggle_frame.pack(side=tk.LEFT, expand=True)
+        tk.Label(candidates_toggle_frame, text="Candidates",
+                 font=('Arial', 10)).pack(side=tk.TOP)
+        self.candidates_toggle = RoundToggleButton(
+            candidates_toggle_frame, command=self.toggle_auto_candidates)
+        self.candidates_toggle.pack(side=tk.TOP, pady=2)
+
         # Sync initial toggle values with the grid (if available)
         main_window = self.parent.winfo_toplevel().window
         if hasattr(main_window, 'grid'):
@@ -64,6 +76,8 @@ class ControlPanel:
             self.box_toggle.set_state(grid.show_box, trigger_command=False)
             self.match_toggle.set_state(
                 grid.show_matching, trigger_command=False)
+            self.candidates_toggle.set_state(
+                grid.auto_candidates, trigger_command=False)
 
         # --- Main control row for New Game, Clear Board, and Comments indicator ---
         controls_frame = tk.Frame(self.frame)
@@ -85,15 +99,39 @@ class ControlPanel:
             command=self.clear_board
         ).pack(side=tk.LEFT, padx=5, expand=True)
 
+        # Undo / Redo buttons (also Ctrl+Z / Ctrl+Y)
+        ttk.Button(
+            controls_frame,
+            text="Undo",
+            style='Rounded.TButton',
+            command=self.undo
+        ).pack(side=tk.LEFT, padx=5, expand=True)
+        ttk.Button(
+            controls_frame,
+            text="Redo",
+            style='Rounded.TButton',
+            command=self.redo
+        ).pack(side=tk.LEFT, padx=5, expand=True)
+
+        # Hint button (the answer is worked out in the background)
+        ttk.Button(
+            controls_frame,
+            text="Hint",
+            style='Rounded.TButton',
+            command=self.show_hint
+        ).pack(side=tk.LEFT, padx=5, expand=True)
+
         # Comments mode indicator with label
         self.comments_frame = tk.Frame(controls_frame)
         self.comments_frame.pack(side=tk.LEFT, padx=5, expand=True)
 
-        tk.Label(
+        comment_key = getattr(getattr(main_window, 'grid', None), 'comment_key', 'c')
+        self.comments_label = tk.Label(
             self.comments_frame,
-            text="Comments Mode (press 'c')",
+            text=f"Comments Mode (press '{comment_key}')",
             font=('Arial', 10)
-        ).pack(side=tk.TOP)
+        )
+        self.comments_label.pack(side=tk.TOP)
         self.comments_indicator = tk.Label(
             self.comments_frame,
             text="OFF",
@@ -113,10 +151,13 @@ class ControlPanel:
         if hasattr(main_window, 'window'):
             main_window.window.control_panel = self
 
+    def set_comment_key(self, comment_key):
+        # The board was rebuilt for another size, which may use another key
+        self.comments_label.config(text=f"Comments Mode (press '{comment_key}')")
+
     def update_comments_indicator(self, is_active):
         """Update the comments mode indicator appearance"""
-        print(
-            f"Control panel updating indicator to: {is_active}")  # Debug print
+        log.debug("Comments indicator %s", "on" if is_active else "off")
 
         # Use the same colors as the toggle button
         if is_active:
@@ -134,10 +175,6 @@ class ControlPanel:
                 fg='white'
             )
 
-        # Force the indicator to update immediately
-        self.comments_indicator.update_idletasks()
-        print("Indicator updated")  # Debug print
-
     def toggle_row_highlight(self):
         new_state = self.row_toggle.active
         main_window = self.parent.winfo_toplevel().window
@@ -178,31 +215,41 @@ class ControlPanel:
                 row, col = grid.selected_cell
                 grid.highlight_cell(row, col)
 
+    def undo(self):
+        main_window = self.parent.winfo_toplevel().window
+        if hasattr(main_window, 'grid'):
+            main_window.grid.undo()
+
+    def redo(self):
+        main_window = self.parent.winfo_toplevel().window
+        if hasattr(main_window, 'grid'):
+            main_window.grid.redo()
+
+    def show_hint(self):
+        main_window = self.parent.winfo_toplevel().window
+        if hasattr(main_window, 'grid'):
+            main_window.grid.show_hint()
+
+    def toggle_auto_candidates(self):
+        new_state = self.candidates_toggle.active
+        main_window = self.parent.winfo_toplevel().window
+        if hasattr(main_window, 'grid'):
+            main_window.grid.set_auto_candidates(new_state)
+
     def back_to_difficulty(self):
         window = self.parent.winfo_toplevel()
 
-        # Reset grid state if it exists
+        # Stop the hidden board from taking key presses
         if hasattr(window.window, 'grid'):
-            window.window.grid.lives = 3
-            window.window.grid.comments_mode = False
-            window.window.grid.selected_cell = None
-            # Unbind lingering events
-            window.window.grid.frame.unbind('<Key>')
-            window.window.grid.frame.unbind('<FocusOut>')
+            window.window.grid.disable_keys()
 
         # Destroy child windows (game-over dialogs, etc.)
         for child in window.winfo_children():
             if isinstance(child, tk.Toplevel):
                 child.destroy()
 
-        # Clear the main frame widgets
-        for widget in self.parent.winfo_children():
-            widget.destroy()
-
-        if hasattr(window.window, 'grid'):
-            delattr(window.window, 'grid')
-
-        window.after(100, window.window.show_difficulty_selection)
+        # The game screen is only hidden, and reset when the next game starts
+        window.window.show_difficulty_selection()
 
     def clear_board(self):
         window = self.parent.winfo_toplevel()
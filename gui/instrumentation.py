@@ -0,0 +1,92 @@
+"""
+Input-to-paint latency measurement.
+
+When enabled (SUDOKU_INSTRUMENT=1), every key press and click handled by
+the grid is timed from the moment its handler starts until Tk has drawn
+the result: an idle callback flushes the pending redraws with
+update_idletasks and then stops the clock. Durations go into one
+LatencyHistogram per action. When disabled, begin() returns straight away.
+"""
+import time
+import tkinter as tk
+
+from constants.settings import INSTRUMENT, LATENCY_OVERLAY_MS
+from utils.histogram import LatencyHistogram
+
+
+class LatencyRecorder:
+    def __init__(self, enabled=INSTRUMENT):
+        self.enabled = enabled
+        self.histograms = {}
+
+    def begin(self, widget, action):
+        """Start timing action; it ends once widget's window has repainted."""
+        if not self.enabled:
+            return
+        widget.after_idle(self._painted, widget, action, time.perf_counter())
+
+    def _painted(self, widget, action, start):
+        # Redraws scheduled by the handler are idle callbacks too; run them
+        # now so the time includes drawing
+        try:
+            widget.update_idletasks()
+        except tk.TclError:
+            return  # Widget went away in the meantime
+        histogram = self.histograms.get(action)
+        if histogram is None:
+            histogram = self.histograms[action] = LatencyHistogram()
+        histogram.add(time.perf_counter() - start)
+
+    def summary(self):
+        return {action: histogram.summary()
+                for action, histogram in sorted(self.histograms.items())}
+
+    def export(self, path):
+        # Imported here: this module loads before the first frame, and
+        # exporting happens once, on close
+        import json
+        import logging
+
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+        logging.getLogger(__name__).info("Wrote input latency to %s", path)
+
+
+# Shared by the grid (which times events) and the window (which shows and
+# exports the results)
+recorder = LatencyRecorder()
+
+
+class LatencyOverlay:
+    """Small table of per-action percentiles in the window's top corner."""
+
+    def __init__(self, root, recorder=recorder):
+        self.root = root
+        self.recorder = recorder
+        self.label = tk.Label(root, font=('Courier', 9), justify='left',
+                              bg='black', fg='white', padx=6, pady=4)
+        self.visible = False
+        self.pending = None  # after() id of the next refresh
+
+    def toggle(self, event=None):
+        self.visible = not self.visible
+        if self.visible:
+            self.label.place(relx=1.0, rely=0.0, anchor='ne')
+            self.label.lift()
+            self.refresh()
+        else:
+            self.label.place_forget()
+            if self.pending is not None:
+                self.root.after_cancel(self.pending)
+                self.pending = None
+
+    def refresh(self):
+        lines = [f"{'action':<16}{'n':>6}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for action, stats in self.recorder.summary().items():
+            lines.append(f"{action:<16}{stats['count']:>6}" + ''.join(
+                f"{stats[key] * 1000:>8.1f}" for key in ('p50', 'p95', 'p99')))
+        if len(lines) == 1:
+            lines.append("no input yet")
+        lines.append("milliseconds, F12 to hide")
+        self.label.config(text='\n'.join(lines))
+        self.pending = self.root.after(LATENCY_OVERLAY_MS, self.refresh)
@@ -0,0 +1,180 @@
+import tkinter as tk
+import tkinter.font as tkfont
+from constants.settings import COLORS, DIGIT_SYMBOLS
+
+
+def cell_layout(widget, size, box):
+    """
+    Pencil-mark offsets inside a cell of this size (one per digit, in a
+    box x box mini grid) and the value and mark fonts. Shared by every
+    cell in widget's window, so Tk parses each font once. Kept on the
+    window's root: fonts belong to one Tk interpreter and go with it.
+    """
+    root = widget.nametowidget('.')
+    layouts = getattr(root, 'cell_layouts', None)
+    if layouts is None:
+        layouts = root.cell_layouts = {}
+    layout = layouts.get((size, box))
+    if layout is None:
+        step = size / (box + 1)
+        positions = tuple(
+            (step * ((n - 1) % box + 1), step * ((n - 1) // box + 1))
+            for n in range(1, box * box + 1)
+        )
+        value_font = tkfont.Font(root=root, family='Arial',
+                                 size=max(8, int(size * 0.4)))
+        mark_font = tkfont.Font(root=root, family='Arial',
+                                size=max(5, int(step * 0.73)))
+        layout = layouts[(size, box)] = (positions, value_font, mark_font)
+    return layout
+
+
+class CanvasCell:
+    """
+    One cell of a BoardCanvas. Offers the same methods and attributes as
+    SudokuCell, but instead of being a widget of its own it owns a few
+    items (background, value, comments) on the shared canvas.
+    """
+
+    def __init__(self, canvas, row, col, x, y, size, box):
+        self.canvas = canvas
+        self.row = row
+        self.col = col
+        self.value = ""
+        self.comments = set()  # Store comments as a set of numbers
+        self.readonly = False
+        self.bg_color = COLORS['white']
+        self.x = x
+        self.y = y
+        self.size = size
+        self.matching_outline = None
+
+        positions, value_font, mark_font = cell_layout(canvas, size, box)
+        self.rect = canvas.create_rectangle(
+            x, y, x + size, y + size, fill=self.bg_color, outline='')
+        self.value_text = canvas.create_text(
+            x + size // 2, y + size // 2,
+            text="",
+            font=value_font,
+            fill='black',
+            anchor='center'
+        )
+        # Every mark exists from the start and is only shown or hidden, so
+        # pencil-marking never creates or deletes canvas items
+        self.mark_items = [
+            canvas.create_text(
+                x + dx, y + dy,
+                text=DIGIT_SYMBOLS[n],
+                font=mark_font,
+                fill='gray40',
+                anchor='center',
+                state='hidden'
+            )
+            for n, (dx, dy) in enumerate(positions)
+        ]
+
+    def set_value(self, value):
+        self.value = DIGIT_SYMBOLS[int(value) - 1] if value else ""
+        self.canvas.itemconfigure(self.value_text, text=self.value)
+        if value:
+            self.clear_comments()
+
+    def add_comment(self, number):
+        if not self.value and not self.readonly:
+            if number in self.comments:
+                self.remove_comment(number)
+            else:
+                self.comments.add(number)
+                self.canvas.itemconfigure(self.mark_items[number - 1],
+                                          state='normal')
+
+    def remove_comment(self, number):
+        if number in self.comments:
+            self.comments.remove(number)
+            self.canvas.itemconfigure(self.mark_items[number - 1],
+                                      state='hidden')
+
+    def set_comments(self, numbers):
+        """Show exactly numbers as comments, touching only those that change."""
+        numbers = set(numbers)
+        for number in self.comments - numbers:
+            self.remove_comment(number)
+        for number in numbers - self.comments:
+            self.add_comment(number)
+
+    def clear_comments(self):
+        for number in self.comments:
+            self.canvas.itemconfigure(self.mark_items[number - 1],
+                                      state='hidden')
+        self.comments.clear()
+
+    def refresh_comments(self):
+        for n, item in enumerate(self.mark_items, 1):
+            self.canvas.itemconfigure(
+                item, state='normal' if n in self.comments else 'hidden')
+
+    def set_readonly(self, readonly):
+        self.readonly = readonly
+        self.set_highlight(COLORS['readonly'] if readonly else COLORS['white'])
+
+    def set_highlight(self, color):
+        # Repainting the whole board on every click mostly sets colors that
+        # are already there, so only real changes reach Tk
+        if color != self.bg_color:
+            self.bg_color = color
+            self.canvas.itemconfigure(self.rect, fill=color)
+
+    def get_highlight(self):
+        return self.bg_color
+
+    def add_matching_outline(self, color):
+        """Draw a colored outline inside the cell boundaries for matching cells."""
+        self.remove_matching_outline()
+        x, y, size = self.x, self.y, self.size
+        self.matching_outline = self.canvas.create_rectangle(
+            x + 2, y + 2, x + size - 2, y + size - 2, outline=color, width=3)
+
+    def remove_matching_outline(self):
+        if self.matching_outline is not None:
+            self.canvas.delete(self.matching_outline)
+            self.matching_outline = None
+
+
+class BoardCanvas(tk.Canvas):
+    """
+    The whole board drawn on a single canvas: one rectangle and one text
+    item per cell plus the grid lines, instead of a Canvas widget per cell.
+    Clicks are mapped back to cells from their coordinates.
+    """
+    PAD = 3  # Room for the outer box border
+
+    def __init__(self, parent, size, box, cell_size, **kwargs):
+        side = size * cell_size + 2 * self.PAD
+        super().__init__(parent, width=side, height=side,
+                         bg=COLORS['white'], highlightthickness=0, **kwargs)
+        self.size = size
+        self.cell_size = cell_size
+        self.cells = {}
+        for i in range(size):
+            for j in range(size):
+                self.cells[(i, j)] = CanvasCell(
+                    self, i, j,
+                    self.PAD + j * cell_size, self.PAD + i * cell_size,
+                    cell_size, box)
+
+        # Grid lines on top of the cell backgrounds; box borders are thicker
+        end = self.PAD + size * cell_size
+        for k in range(size + 1):
+            pos = self.PAD + k * cell_size
+            width = 3 if k % box == 0 else 1
+            color = 'black' if k % box == 0 else 'gray70'
+            self.create_line(self.PAD, pos, end, pos, width=width, fill=color)
+            self.create_line(pos, self.PAD, pos, end, width=width, fill=color)
+
+    def cell_at(self, x, y):
+        """(row, col) of the cell under canvas point x, y, or None."""
+        col = int((x - self.PAD) // self.cell_size)
+        row = int((y - self.PAD) // self.cell_size)
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return row, col
+        return None
@@ -1,101 +1,107 @@
 import tkinter as tk
-from constants.settings import COLORS
+from constants.settings import COLORS, DIGIT_SYMBOLS
+from gui.widgets.board_canvas import cell_layout
+
 
 class SudokuCell(tk.Canvas):
-    def __init__(self, parent, row, col, **kwargs):
-        super().__init__(parent, width=60, height=60, bg=COLORS['white'], highlightthickness=1, **kwargs)
+    def __init__(self, parent, row, col, size=60, box=3, **kwargs):
+        super().__init__(parent, width=size, height=size,
+                         bg=COLORS['white'], highlightthickness=1, **kwargs)
         self.row = row
         self.col = col
         self.value = ""
         self.comments = set()  # Store comments as a set of numbers
         self.readonly = False
         self.bg_color = COLORS['white']
-        
-        # Fixed positions for each number 1-9 in a 3x3 grid
-        self.comment_positions = {
-            1: (15, 15),   # Top-left
-            2: (30, 15),   # Top-middle
-            3: (45, 15),   # Top-right
-            4: (15, 30),   # Middle-left
-            5: (30, 30),   # Center
-            6: (45, 30),   # Middle-right
-            7: (15, 45),   # Bottom-left
-            8: (30, 45),   # Bottom-middle
-            9: (45, 45)    # Bottom-right
-        }
-        
+        self.size = size  # Store size for matching outline drawing
+        self.matching_outline = None  # Initialize matching outline
+
+        # Mark positions and fonts are shared by all cells of this size
+        positions, value_font, mark_font = cell_layout(self, size, box)
+
         # Create text items for main value and comments
         # Center the main value text
         self.value_text = self.create_text(
-            30, 30,  # Center of the 60x60 cell
+            size // 2, size // 2,  # Center of the cell
             text="",
-            font=('Arial', 24),  # Larger font for main value
+            font=value_font,  # Larger font for main value
             fill='black',
             anchor='center'  # Ensure text is centered
         )
-        self.comment_texts = {}  # Dictionary to store comment text items
-        
+        # One hidden text item per possible comment, below the value text;
+        # toggling a comment only changes its state
+        self.mark_items = []
+        for n, (x, y) in enumerate(positions):
+            item = self.create_text(
+                x, y,
+                text=DIGIT_SYMBOLS[n],
+                font=mark_font,
+                fill='gray40',
+                anchor='center',
+                state='hidden'
+            )
+            self.tag_lower(item, self.value_text)
+            self.mark_items.append(item)
+
     def set_value(self, value):
-        self.value = value
-        self.itemconfig(self.value_text, text=str(value) if value else "")
-        if value:  # Clear comments when setting a value
+        # Values are digits; boards above 9x9 show them as letters from A
+        self.value = DIGIT_SYMBOLS[int(value) - 1] if value else ""
+        self.itemconfig(self.value_text, text=self.value)
+        if value:
             self.clear_comments()
-            
+
     def add_comment(self, number):
         if not self.value and not self.readonly:  # Only add comments to empty, non-readonly cells
             if number in self.comments:
                 self.remove_comment(number)
             else:
                 self.comments.add(number)
-                x, y = self.comment_positions[number]
-                self.comment_texts[number] = self.create_text(
-                    x, y,
-                    text=str(number),
-                    font=('Arial', 11),  # Slightly smaller for better fit
-                    fill='gray40',
-                    anchor='center'
-                )
-                # Raise comment text above background but below value text
-                self.tag_lower(self.comment_texts[number], self.value_text)
-            
+                self.itemconfig(self.mark_items[number - 1], state='normal')
+
     def remove_comment(self, number):
         if number in self.comments:
             self.comments.remove(number)
-            if number in self.comment_texts:
-                self.delete(self.comment_texts[number])
-                del self.comment_texts[number]
-            
+            self.itemconfig(self.mark_items[number - 1], state='hidden')
+
+    def set_comments(self, numbers):
+        """Show exactly numbers as comments, touching only those that change."""
+        numbers = set(numbers)
+        for number in self.comments - numbers:
+            self.remove_comment(number)
+        for number in numbers - self.comments:
+            self.add_comment(number)
+
     def clear_comments(self):
-        for item in self.comment_texts.values():
-            self.delete(item)
-        self.comment_texts.clear()
+        for number in self.comments:
+            self.itemconfig(self.mark_items[number - 1], state='hidden')
         self.comments.clear()
-            
+
     def refresh_comments(self):
-        # Clear existing comment texts
-        for item in self.comment_texts.values():
-            self.delete(item)
-        self.comment_texts.clear()
-        
-        # Recreate all comment texts in their fixed positions
-        for number in self.comments:
-            x, y = self.comment_positions[number]
-            self.comment_texts[number] = self.create_text(
-                x, y,
-                text=str(number),
-                font=('Arial', 12),
-                fill='gray40',
-                anchor='center'
-            )
-            
+        # Show exactly the marks in self.comments
+        for n, item in enumerate(self.mark_items, 1):
+            self.itemconfig(item, state='normal' if n in self.comments else 'hidden')
+
     def set_readonly(self, readonly):
         self.readonly = readonly
         self.bg_color = COLORS['readonly'] if readonly else COLORS['white']
         self.configure(bg=self.bg_color)
-        
+
     def set_highlight(self, color):
         self.bg_color = color
         self.configure(bg=color)
-        
+
     def get_highlight(self):
-        return self.bg_color 
\ No newline at end of file
+        return self.bg_color
+
+    def add_matching_outline(self, color):
+        """Draw a colored outline inside the cell boundaries for matching cells."""
+        self.remove_matching_outline()
+        # Draw an inner rectangle so the original border remains visible.
+        self.matching_outline = self.create_rectangle(
+            2, 2, self.size - 2, self.size - 2, outline=color, width=3)
+
+    def remove_matching_outline(self):
+        """Remove the matching outline if it exists."""
+        if self.matching_outline is not None:
+            self.delete(self.matching_outline)
+            self.matching_outline = None
@@ -1,6 +1,7 @@
 import tkinter as tk
 import math
 from constants.settings import COLORS
+from gui.animation import clock_for
 
 class RoundToggleButton(tk.Canvas):
     def __init__(self, parent, width=60, height=30, padding=3, command=None):
@@ -13,8 +14,7 @@ class RoundToggleButton(tk.Canvas):
         
         # Animation settings
         self.animation_duration = 250  # Slightly faster animation
-        self.animation_steps = 25
-        self.animation_running = False
+        self.animation = None  # Tween on the shared clock while moving
         
         # Calculate dimensions
         self.rail_height = height - 2*padding
@@ -82,55 +82,36 @@ class RoundToggleButton(tk.Canvas):
             tags='rail'
         )
 
-    def animate_toggle(self, start_x, end_x, step=0):
-        if step <= self.animation_steps:
-            # Enhanced easing function for more pronounced animation
-            progress = step / self.animation_steps
-            # Elastic ease-out for more bounce
-            if progress < 0.5:
-                fraction = 4 * progress * progress * progress
-            else:
-                p = progress - 1
-                fraction = 1 + 4 * p * p * p + math.sin(progress * 4) * 0.1  # Add slight bounce
-                
-            current_x = start_x + (end_x - start_x) * fraction
-            
-            # Update circle and shadow position
-            circle_y = self.height//2
-            shadow_offset = 2
-            
-            # Update shadow position
-            self.coords(self.circle_shadow,
-                       current_x-shadow_offset, circle_y-self.circle_diameter//2-shadow_offset,
-                       current_x+self.circle_diameter+shadow_offset, circle_y+self.circle_diameter//2+shadow_offset)
-            
-            # Update circle position
-            self.coords(self.circle,
-                       current_x, circle_y-self.circle_diameter//2,
-                       current_x+self.circle_diameter, circle_y+self.circle_diameter//2)
-            
-            # Interpolate colors
-            if self.active:
-                color = COLORS['toggle_active']
-            else:
-                color = COLORS['toggle_inactive']
-            
-            # Update all rail parts
-            self.itemconfig('rail', fill=color)
-            
-            # Schedule next animation frame
-            self.after(self.animation_duration // self.animation_steps, 
-                      lambda: self.animate_toggle(start_x, end_x, step + 1))
+    def move_circle(self, x):
+        circle_y = self.height//2
+        shadow_offset = 2
+        self.coords(self.circle_shadow,
+                   x-shadow_offset, circle_y-self.circle_diameter//2-shadow_offset,
+                   x+self.circle_diameter+shadow_offset, circle_y+self.circle_diameter//2+shadow_offset)
+        self.coords(self.circle,
+                   x, circle_y-self.circle_diameter//2,
+                   x+self.circle_diameter, circle_y+self.circle_diameter//2)
+
+    def animate_toggle(self, start_x, end_x, progress):
+        # One frame of the slide, driven by the shared animation clock
+        # Enhanced easing function for more pronounced animation
+        if progress < 0.5:
+            fraction = 4 * progress * progress * progress
+        elif progress < 1:
+            p = progress - 1
+            fraction = 1 + 4 * p * p * p + math.sin(progress * 4) * 0.1  # Add slight bounce
         else:
-            self.animation_running = False
-            if self.command:
-                self.command()
-        
+            fraction = 1  # Settle exactly on the end position
+
+        self.move_circle(start_x + (end_x - start_x) * fraction)
+
+    def animation_done(self):
+        self.animation = None
+
     def toggle(self, event=None):
-        if self.animation_running:
+        if self.animation is not None:
             return
-            
-        self.animation_running = True
+
         self.active = not self.active
         
         if self.active:
@@ -144,9 +125,12 @@ class RoundToggleButton(tk.Canvas):
             
         # Update rail color immediately
         self.itemconfig('rail', fill=COLORS['toggle_active'] if self.active else COLORS['toggle_inactive'])
-        self.animate_toggle(start_x, end_x)
+        self.animation = clock_for(self).animate(
+            self.animation_duration,
+            lambda progress: self.animate_toggle(start_x, end_x, progress),
+            self.animation_done)
         
-        # Call the command after toggling state
+        # Call the command once, right away; the slide is only cosmetic
         if self.command:
             self.command()
 
@@ -157,14 +141,10 @@ class RoundToggleButton(tk.Canvas):
             # Update the rail color immediately
             self.itemconfig('rail', fill=COLORS['toggle_active'] if active else COLORS['toggle_inactive'])
             # Move circle to correct position without animation
-            circle_y = self.height//2
-            x = self.width - self.padding - self.circle_diameter - 4 if active else self.padding + 4
-            shadow_offset = 2
-            self.coords(self.circle_shadow,
-                       x-shadow_offset, circle_y-self.circle_diameter//2-shadow_offset,
-                       x+self.circle_diameter+shadow_offset, circle_y+self.circle_diameter//2+shadow_offset)
-            self.coords(self.circle,
-                       x, circle_y-self.circle_diameter//2,
-                       x+self.circle_diameter, circle_y+self.circle_diameter//2)
+            if self.animation is not None:
+                clock_for(self).cancel(self.animation)
+                self.animation = None
+            self.move_circle(self.width - self.padding - self.circle_diameter - 4
+                             if active else self.padding + 4)
             if trigger_command and self.command:
                 self.command() 
\ No newline at end of file
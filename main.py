@@ -1,10 +1,111 @@
-from gui.base_window import SudokuWindow
-from game.sudoku import SudokuGame
+import sys
+import threading
+
+from constants.settings import LOG_LEVEL, PUZZLE_BANK_FILE, WARM_UP_DELAY_MS
+
+
+def start_gui():
+    """
+    Build the window and its difficulty screen and return it. The puzzle
+    bank, the background pool and the game screen are left to warm_up,
+    which runs once the first frame is up.
+    """
+    # Imported here so headless commands work on machines without Tk
+    from gui.base_window import SudokuWindow
+    from game.sudoku import SudokuGame
 
-def main():
     game = SudokuGame()
     window = SudokuWindow(game)
+    window.root.after(WARM_UP_DELAY_MS, lambda: warm_up(game))
+    return window
+
+
+def configure_logging():
+    import logging
+
+    level = logging.getLevelName(LOG_LEVEL.upper())
+    if not isinstance(level, int):
+        # Unknown SUDOKU_LOG_LEVEL; getLevelName gives back a string
+        level = logging.WARNING
+    logging.basicConfig(level=level,
+                        format='%(levelname)s %(name)s: %(message)s')
+
+
+def warm_up(game):
+    # Runs on the Tk thread, like every other change to game, so a game
+    # being started never sees the pool or bank half set up
+    from game.bank import PuzzleBank
+
+    # logging takes about as long to import as the window itself, so it
+    # is set up here; until now only warnings reach stderr, through
+    # logging's fallback handler
+    configure_logging()
+
+    # Prefer the pre-built bank; only run background generation without one
+    pool = None
+    bank = PuzzleBank.open(PUZZLE_BANK_FILE)
+    if bank is not None:
+        game.generator.bank = bank
+    else:
+        from game.pool import PuzzlePool
+
+        # Not started yet: until its workers are up, get() finds the queues
+        # empty and games are generated as before
+        pool = game.pool = PuzzlePool()
+
+    # Starting the pool (about 150 ms for the fork server) and loading the
+    # game screen's modules happen on a thread, so neither holds up the
+    # main loop; neither touches Tk, and the pool locks its own state
+    threading.Thread(target=warm_up_in_background, args=(pool,),
+                     name='warm-up', daemon=True).start()
+
+
+def warm_up_in_background(pool):
+    if pool is not None:
+        # Fills every difficulty, so the first game is usually ready
+        pool.start()
+    import_game_screen()
+
+
+def import_game_screen():
+    import gui.controls
+    import gui.grid
+
+
+def run_gui():
+    window = start_gui()
     window.run()
+    return 0
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        # Plain launch: skip building the command-line parser (and loading
+        # the batch tools) on the way to the first frame
+        return run_gui()
+
+    import argparse
+    from game import batch
+
+    parser = argparse.ArgumentParser(
+        description="Play Sudoku, or run one of the headless commands.")
+    commands = parser.add_subparsers(dest='command')
+    generate = commands.add_parser(
+        'generate', help="generate puzzles to stdout or a file")
+    batch.add_generate_arguments(generate)
+    solve = commands.add_parser(
+        'solve', help="solve a file of puzzles, writing solutions in order")
+    batch.add_solve_arguments(solve)
+
+    args = parser.parse_args(argv)
+    if args.command == 'generate':
+        return batch.run_generate(args)
+    if args.command == 'solve':
+        return batch.run_solve(args)
+    return run_gui()
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,14 @@
+import os
+
+from game.batch import read_puzzles
+from game.board import Board
+
+CORPORA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       'benchmarks', 'corpora')
+
+
+def load(name, count=None):
+    """The first count puzzles of a benchmarks/corpora file, as Boards."""
+    boards = [Board.from_string(text)
+              for text in read_puzzles(os.path.join(CORPORA, name))]
+    return boards if count is None else boards[:count]
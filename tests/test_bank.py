@@ -0,0 +1,100 @@
+import mmap
+import random
+
+import pytest
+
+from game.bank import RECORD_SIZE, BankError, PuzzleBank, build_bank, verify_bank
+from game.solver import count_solutions
+
+
+@pytest.fixture(scope='module')
+def bank_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('bank') / 'puzzles.bank')
+    build_bank(path, {'Easy': 3, 'Medium': 2}, workers=1)
+    return path
+
+
+def corrupt(path, offset, value):
+    with open(path, 'r+b') as f:
+        f.seek(offset)
+        f.write(bytes([value]))
+
+
+def test_built_bank_verifies(bank_path):
+    assert verify_bank(bank_path, check_unique=True) == []
+    with PuzzleBank(bank_path) as bank:
+        assert bank.count('Easy') == 3 and bank.count('Medium') == 2
+        puzzle, solution = bank.get('Medium', 1)
+        assert count_solutions(puzzle) == 1
+        assert all(not p or p == s for p, s in zip(puzzle.cells, solution.cells))
+
+
+def test_flipped_record_byte_fails_the_checksum(bank_path, tmp_path):
+    path = str(tmp_path / 'corrupt.bank')
+    with open(bank_path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data)
+    # The last cell of the last solution: one digit swapped for another
+    last = len(data) - 1
+    corrupt(path, last, data[last] % 9 + 1)
+    problems = verify_bank(path)
+    assert "checksum mismatch" in problems
+    assert any("invalid solution" in problem for problem in problems)
+
+
+def test_index_past_the_end_is_rejected(bank_path, tmp_path):
+    path = str(tmp_path / 'truncated.bank')
+    with open(bank_path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:-RECORD_SIZE])
+    with pytest.raises(BankError):
+        PuzzleBank(path)
+    assert PuzzleBank.open(path) is None
+    assert verify_bank(path)
+
+
+def test_wrong_magic_is_rejected(bank_path, tmp_path):
+    path = str(tmp_path / 'other.bank')
+    with open(bank_path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(b'NOTABANK' + data[8:])
+    with pytest.raises(BankError, match="not a puzzle bank"):
+        PuzzleBank(path)
+    assert PuzzleBank.open(path) is None
+
+
+def test_missing_bank(tmp_path):
+    assert PuzzleBank.open(str(tmp_path / 'missing.bank')) is None
+    assert len(verify_bank(str(tmp_path / 'missing.bank'))) == 1
+
+
+def test_failed_open_closes_the_map(bank_path, tmp_path, monkeypatch):
+    path = str(tmp_path / 'other.bank')
+    with open(bank_path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(b'NOTABANK' + data[8:])
+    maps = []
+    real_mmap = mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        maps.append(real_mmap(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(mmap, 'mmap', recording_mmap)
+    with pytest.raises(BankError):
+        PuzzleBank(path)
+    assert len(maps) == 1 and maps[0].closed
+
+
+def test_records_and_random_pick(bank_path):
+    with PuzzleBank(bank_path) as bank:
+        assert len(bank.records()) == 5 * RECORD_SIZE
+        puzzle, solution = bank.random('Easy', random.Random(0))
+        assert puzzle.size == 9 and count_solutions(puzzle) == 1
+        assert 'Easy' in bank and 'Expert' not in bank
+        with pytest.raises(IndexError):
+            bank.get('Easy', 3)
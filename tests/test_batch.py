@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+
+import main
+from game.batch import generate_lines, read_puzzles, solve_lines
+from game.board import Board
+from game.solver import count_solutions, solve
+from .corpora import CORPORA, load
+
+
+def parse(line):
+    record = json.loads(line)
+    return (record, Board.from_string(record['puzzle']),
+            Board.from_string(record['solution']))
+
+
+def test_generate_lines_in_process():
+    lines = list(generate_lines({'Easy': 3, 'Medium': 2}, workers=1, chunk_size=2))
+    assert len(lines) == 5
+    difficulties = []
+    for line in lines:
+        record, puzzle, solution = parse(line)
+        difficulties.append(record['difficulty'])
+        assert record['size'] == 9
+        assert count_solutions(puzzle) == 1
+        assert solve(puzzle) == solution.to_rows()
+    assert sorted(difficulties) == ['Easy'] * 3 + ['Medium'] * 2
+
+
+def test_generate_lines_across_workers():
+    lines = list(generate_lines({'Easy': 4}, workers=2, chunk_size=1, fmt='81char'))
+    assert len(lines) == 4
+    for line in lines:
+        assert len(line) == 81
+        assert count_solutions(Board.from_string(line)) == 1
+
+
+def test_generate_lines_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        list(generate_lines({'Easy': 1}, workers=1, fmt='csv'))
+
+
+def test_generate_stops_early_without_error():
+    lines = generate_lines({'Easy': 50}, workers=2, chunk_size=1)
+    assert parse(next(lines))[0]['difficulty'] == 'Easy'
+    lines.close()
+
+
+def test_generate_command(tmp_path, capsys):
+    output = tmp_path / 'pack.ndjson'
+    assert main.main(['generate', '--count', '2', '--difficulty', 'Easy',
+                      '--size', '4', '--workers', '1', '--output', str(output)]) == 0
+    lines = output.read_text().splitlines()
+    assert len(lines) == 2
+    for line in lines:
+        record, puzzle, solution = parse(line)
+        assert record['size'] == 4 and count_solutions(puzzle) == 1
+    assert "Generated 2 puzzles" in capsys.readouterr().err
+
+
+def solve_all(puzzles, **kwargs):
+    lines, latencies = [], []
+    for chunk_lines, chunk_latencies in solve_lines(puzzles, **kwargs):
+        lines.extend(chunk_lines)
+        latencies.extend(chunk_latencies)
+    assert len(latencies) == len(lines)
+    return lines
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_solve_lines_keep_input_order(workers):
+    puzzles = [board.to_string() for board in load('hard.txt') + load('easy.txt')]
+    lines = solve_all(puzzles, workers=workers, chunk_size=7)
+    assert lines == [Board.from_rows(solve(Board.from_string(p))).to_string()
+                     for p in puzzles]
+
+
+def test_solve_lines_report_bad_puzzles():
+    easy = load('easy.txt', 1)[0]
+    clash = easy.copy()
+    row = clash.to_rows()[0]
+    clash[0, row.index(0)] = next(d for d in row if d)
+    open_grid = easy.copy()
+    open_grid.cells[:18] = bytes(18)
+    puzzles = ['12x', clash.to_string(), open_grid.to_string(), easy.to_string()]
+    lines = solve_all(puzzles, workers=1, check_unique=True)
+    assert lines[:3] == ['invalid', 'unsolvable', 'multiple']
+    assert count_solutions(Board.from_string(lines[3])) == 1
+
+
+def test_read_puzzles_skips_comments_and_reads_ndjson(tmp_path):
+    easy = load('easy.txt', 2)
+    path = tmp_path / 'mixed.txt'
+    path.write_text("# header\n\n" + easy[0].to_string() + "\n"
+                    + json.dumps({'puzzle': easy[1].to_string()}) + "\n")
+    assert list(read_puzzles(str(path))) == [b.to_string() for b in easy]
+    empty = tmp_path / 'empty.txt'
+    empty.write_text("")
+    assert list(read_puzzles(str(empty))) == []
+
+
+def test_solve_command(tmp_path, capsys):
+    output = tmp_path / 'solutions.txt'
+    assert main.main(['solve', os.path.join(CORPORA, 'hard.txt'), '--workers', '1',
+                      '--unique', '--output', str(output)]) == 0
+    count = len(load('hard.txt'))
+    assert len(output.read_text().splitlines()) == count
+    assert f"Solved {count} of {count}" in capsys.readouterr().err
@@ -0,0 +1,75 @@
+import pytest
+
+from game.board import Board
+from game.generator import SudokuGenerator
+from game.sudoku import SudokuGame
+from utils.storage import GameStorage
+from .corpora import load
+
+
+@pytest.mark.parametrize('size', [4, 9, 16, 25])
+def test_round_trips(size):
+    puzzle, solution = SudokuGenerator().generate_puzzle(
+        'Easy', size=size, seed=1)
+    for board in (puzzle, solution):
+        assert Board.from_string(board.to_string()) == board
+        assert Board.from_rows(board.to_rows()) == board
+        assert Board(size, board.to_bytes()) == board
+        assert eval(repr(board)) == board
+        assert [list(row) for row in board] == board.to_rows()
+        assert len(board) == size
+
+
+def test_large_board_strings_use_letters():
+    _, solution = SudokuGenerator().generate_puzzle('Easy', size=16, seed=1)
+    text = solution.to_string()
+    assert set(text) == set("123456789ABCDEFG")
+    assert Board.from_string(text.lower()) == solution
+
+
+def test_dots_read_as_empty():
+    puzzle = load('easy.txt', 1)[0]
+    assert Board.from_string(puzzle.to_string().replace('0', '.')) == puzzle
+
+
+@pytest.mark.parametrize('text', ['1' * 80, '1' * 82, '0' * 80 + 'x',
+                                  '0' * 15 + '5', '1' * 9])
+def test_bad_strings_are_rejected(text):
+    with pytest.raises(ValueError):
+        Board.from_string(text)
+
+
+def test_wrong_cell_count_is_rejected():
+    with pytest.raises(ValueError):
+        Board(9, bytes(80))
+
+
+def test_copies_and_views():
+    board = load('easy.txt', 1)[0]
+    idx = board.cells.index(0)
+    row, col = divmod(idx, 9)
+    copy = board.copy()
+    view = board.memoryview()
+    board[row, col] = 7
+    assert view[idx] == 7 and board[row, col] == 7
+    assert copy[row, col] == 0 and copy != board
+    assert board.filled() == copy.filled() + 1
+
+
+def test_boards_hash_by_content():
+    first, second = load('easy.txt', 2)
+    assert len({first, first.copy(), second}) == 2
+    assert first != first.to_string()
+
+
+def test_save_file_round_trip(tmp_path):
+    game = SudokuGame()
+    try:
+        game.storage = GameStorage(str(tmp_path / 'save.json'))
+        game.start_new_game('Easy', 16, seed=1)
+        game.save()
+        data = game.storage.load_game()
+        assert data['puzzle'] == game.puzzle and data['solution'] == game.solution
+        assert data['puzzle'].size == 16
+    finally:
+        game.shutdown()
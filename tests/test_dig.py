@@ -0,0 +1,59 @@
+import random
+
+from constants.settings import DIFFICULTY_LEVELS
+from game import solver
+from game.board import Board
+from game.generator import SudokuGenerator
+from .corpora import load
+
+
+def solved():
+    return Board.from_rows(solver.solve(load('easy.txt', 1)[0]))
+
+
+def test_generated_puzzles_are_unique():
+    generator = SudokuGenerator(seed=1)
+    for difficulty in ('Easy', 'Medium'):
+        puzzle, solution = generator.generate_puzzle(difficulty)
+        assert solver.count_solutions(puzzle) == 1
+        assert solver.solve(puzzle) == solution.to_rows()
+        assert puzzle.filled() >= DIFFICULTY_LEVELS[difficulty]
+
+
+def test_dig_stops_at_remove_count():
+    solution = solved()
+    cells = list(range(81))
+    random.Random(0).shuffle(cells)
+    puzzle = Board.from_rows(solver.dig(solution, cells, 30))
+    assert puzzle.filled() == 51
+    assert solver.count_solutions(puzzle) == 1
+
+
+def test_dig_keeps_every_removal_unique():
+    # Asking for every cell leaves a minimal puzzle: no clue can go
+    solution = solved()
+    cells = list(range(81))
+    random.Random(1).shuffle(cells)
+    puzzle = Board.from_rows(solver.dig(solution, cells, 81))
+    assert solver.count_solutions(puzzle) == 1
+    for idx in range(81):
+        if puzzle.cells[idx]:
+            trial = puzzle.copy()
+            trial.cells[idx] = 0
+            assert solver.count_solutions(trial) == 2
+
+
+def test_dig_only_tries_the_given_cells():
+    solution = solved()
+    puzzle = Board.from_rows(solver.dig(solution, range(9), 81))
+    assert all(puzzle.cells[9:]) and puzzle.filled() < 81
+
+
+def test_exhausted_probe_keeps_its_clue():
+    solution = solved()
+    cells = list(range(81))
+    random.Random(2).shuffle(cells)
+    bounded = Board.from_rows(solver.dig(solution, cells, 81, max_nodes=1))
+    free = Board.from_rows(solver.dig(solution, cells, 81))
+    assert bounded.filled() >= free.filled()
+    assert solver.count_solutions(bounded) == 1
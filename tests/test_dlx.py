@@ -0,0 +1,63 @@
+import pytest
+
+from game import dlx, solver
+from game.backends import BACKENDS, compare_backends, get_backend
+from game.generator import SudokuGenerator
+from .corpora import load
+
+
+def open_grid():
+    puzzle = load('easy.txt', 1)[0]
+    puzzle.cells[:18] = bytes(18)
+    return puzzle
+
+
+@pytest.mark.parametrize('puzzle', load('easy.txt', 5) + load('hard.txt', 5)
+                         + load('17clue.txt', 3))
+def test_dlx_matches_bitmask_solver(puzzle):
+    assert dlx.solve(puzzle) == solver.solve(puzzle)
+    assert dlx.count_solutions(puzzle) == solver.count_solutions(puzzle) == 1
+
+
+def test_dlx_enumerates_the_same_solutions():
+    puzzle = open_grid()
+    assert (sorted(map(str, dlx.iter_solutions(puzzle)))
+            == sorted(map(str, solver.iter_solutions(puzzle))))
+    assert dlx.count_solutions(puzzle, limit=50) == solver.count_solutions(puzzle, limit=50)
+
+
+def test_dlx_rejects_clashing_clues():
+    puzzle = load('easy.txt', 1)[0]
+    row = puzzle.to_rows()[0]
+    puzzle[0, row.index(0)] = next(d for d in row if d)
+    assert dlx.solve(puzzle) is None
+    assert dlx.count_solutions(puzzle) == 0
+
+
+def test_matrix_is_restored_after_an_early_stop():
+    puzzle = open_grid()
+    solutions = dlx.iter_solutions(puzzle)
+    next(solutions)
+    solutions.close()
+    hard = load('hard.txt', 1)[0]
+    assert dlx.solve(hard) == solver.solve(hard)
+
+
+def test_dlx_node_budget():
+    with pytest.raises(solver.NodeBudgetExceeded):
+        dlx.count_solutions(open_grid(), 2, {'nodes': 0, 'max_nodes': 5})
+
+
+@pytest.mark.parametrize('size', [4, 16])
+def test_dlx_solves_other_sizes(size):
+    puzzle, solution = SudokuGenerator().generate_puzzle('Easy', size=size, seed=1)
+    assert dlx.solve(puzzle) == solution.to_rows()
+
+
+def test_backend_selection():
+    assert get_backend('dlx') is dlx
+    assert get_backend() is solver
+    with pytest.raises(ValueError):
+        get_backend('nope')
+    results = compare_backends(load('hard.txt', 3))
+    assert set(results) == set(BACKENDS)
@@ -0,0 +1,55 @@
+import pytest
+
+from game.generator import SudokuGenerator
+from game.grader import (GRADES, UNSOLVED_RANK, CandidateGrid, bucket, grade,
+                          next_step, rate)
+from game.solver import solve
+from .corpora import load
+
+
+@pytest.mark.parametrize('rank, name', [(1, 'Easy'), (2, 'Medium'), (3, 'Hard'),
+                                        (4, 'Expert'), (UNSOLVED_RANK, 'Expert')])
+def test_bucket(rank, name):
+    assert GRADES[bucket(rank)] == name
+
+
+@pytest.mark.parametrize('puzzle', load('easy.txt', 5))
+def test_singles_only_puzzles_grade_easy(puzzle):
+    assert rate(puzzle) == 1
+    assert grade(puzzle) == 'Easy'
+
+
+def test_puzzles_beyond_the_techniques_grade_expert():
+    # AI Escargot and Easter Monster need more than fish and subsets
+    for puzzle in load('hard.txt', 2):
+        assert rate(puzzle) == UNSOLVED_RANK
+        assert grade(puzzle) == 'Expert'
+
+
+def test_time_budget_gives_up_as_unsolved():
+    puzzle = load('easy.txt', 1)[0]
+    assert rate(puzzle, time_budget=-1) == UNSOLVED_RANK
+
+
+def test_steps_are_sound():
+    # Every step the grader takes agrees with the solution
+    for puzzle in load('easy.txt', 3) + load('hard.txt', 4)[2:]:
+        solution = solve(puzzle)
+        cells = [value for row in solution for value in row]
+        grid = CandidateGrid(puzzle)
+        while not grid.solved():
+            step, _ = next_step(grid)
+            if step is None:
+                break
+            for idx, digit in step.placements:
+                assert cells[idx] == digit
+            for idx, digit in step.eliminations:
+                assert cells[idx] != digit
+            grid.apply(step)
+
+
+def test_generated_puzzles_grade_as_asked():
+    generator = SudokuGenerator(seed=0)
+    for difficulty in ('Easy', 'Medium'):
+        puzzle, _ = generator.generate_puzzle(difficulty)
+        assert grade(puzzle) == difficulty
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+import pytest
+
+from constants.settings import DIGIT_SYMBOLS
+from game.board import Board
+from game.generator import SudokuGenerator
+from game.grader import CandidateGrid, find_naked_single
+from game.hints import HintEngine
+from game.solver import solve
+from .corpora import load
+
+
+@pytest.fixture
+def engine():
+    engine = HintEngine(cache_size=2)
+    yield engine
+    engine.shutdown()
+
+
+def solution_of(puzzle):
+    return Board.from_rows(solve(puzzle))
+
+
+def test_hint_is_a_sound_step(engine):
+    puzzle = load('easy.txt', 1)[0]
+    solution = solution_of(puzzle)
+    step = engine.request(puzzle, solution).result(timeout=10)
+    assert step.placements or step.eliminations
+    for idx, digit in step.placements:
+        assert not puzzle.cells[idx] and solution.cells[idx] == digit
+    for idx, digit in step.eliminations:
+        assert solution.cells[idx] != digit
+
+
+def test_repeat_request_is_served_from_the_cache(engine):
+    puzzle = load('easy.txt', 1)[0]
+    solution = solution_of(puzzle)
+    step = engine.request(puzzle, solution).result(timeout=10)
+    again = engine.request(puzzle.copy(), solution)
+    assert again.done() and again.result() is step
+    assert (engine.hits, engine.misses) == (1, 1)
+
+
+def test_cache_is_keyed_by_board(engine):
+    first, second, third = load('easy.txt', 3)
+    for puzzle in (first, second, third):
+        engine.request(puzzle, solution_of(puzzle)).result(timeout=10)
+    assert len(engine.cache) == 2
+    # The oldest board was evicted, so asking again works it out anew
+    engine.request(first, solution_of(first)).result(timeout=10)
+    assert (engine.hits, engine.misses) == (0, 4)
+
+
+def test_reveal_when_no_technique_applies(engine):
+    # Easter Monster is beyond the techniques from the start
+    puzzle = load('hard.txt', 2)[1]
+    solution = solution_of(puzzle)
+    step = engine.request(puzzle, solution).result(timeout=10)
+    assert step.technique == 'Reveal'
+    (idx, digit), = step.placements
+    assert not puzzle.cells[idx] and solution.cells[idx] == digit
+
+
+def test_solved_board_has_no_hint(engine):
+    puzzle = load('easy.txt', 1)[0]
+    solution = solution_of(puzzle)
+    assert engine.request(solution, solution).result(timeout=10) is None
+
+
+def test_large_board_hints_use_board_symbols():
+    _, solution = SudokuGenerator().generate_puzzle('Easy', size=16, seed=1)
+    idx = next(i for i, d in enumerate(solution.cells) if d >= 10)
+    puzzle = solution.copy()
+    puzzle.cells[idx] = 0
+    step = find_naked_single(CandidateGrid(puzzle))
+    symbol = DIGIT_SYMBOLS[solution.cells[idx] - 1]
+    assert step.explanation.endswith(f"can only be {symbol}")
+
+
+def poll_hint_after(change):
+    """Label text the grid shows for a hint asked before change(game)."""
+    pytest.importorskip('tkinter')
+    from game.sudoku import SudokuGame
+    from gui.grid import SudokuGrid
+
+    class Cell:
+        def set_highlight(self, color):
+            pass
+
+    game = SudokuGame()
+    try:
+        game.start_new_game('Easy', 9, seed=3)
+        label = {}
+        grid = SimpleNamespace(
+            game_logic=game, hint_future=None, game_over_active=False, size=9,
+            cells={(r, c): Cell() for r in range(9) for c in range(9)},
+            hint_label=SimpleNamespace(config=lambda **kw: label.update(kw)),
+            frame=SimpleNamespace(winfo_exists=lambda: True,
+                                  after=lambda *args: None))
+        grid.poll_hint = lambda: None
+        empty = [i for i, d in enumerate(game.state.cells) if not d]
+        game.make_move(*divmod(empty[0], 9), game.solution.cells[empty[0]])
+        SudokuGrid.show_hint(grid)
+        grid.hint_future.result(timeout=10)
+        change(game, empty)
+        SudokuGrid.poll_hint(grid)
+        return label['text']
+    finally:
+        game.shutdown()
+
+
+def test_grid_shows_hint_for_an_unchanged_board():
+    assert poll_hint_after(lambda game, empty: None)
+
+
+def test_grid_drops_hint_for_a_changed_board():
+    def undo_and_play_elsewhere(game, empty):
+        # The filled count ends where it was when the hint was asked for
+        game.undo()
+        game.make_move(*divmod(empty[1], 9), game.solution.cells[empty[1]])
+
+    assert poll_hint_after(undo_and_play_elsewhere) == ""
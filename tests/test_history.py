@@ -0,0 +1,123 @@
+import pytest
+
+from game.sudoku import GROUP_FLAG, NOTE_FLAG, SudokuGame
+from utils.storage import GameStorage
+
+
+@pytest.fixture
+def game(tmp_path):
+    game = SudokuGame()
+    game.storage = GameStorage(str(tmp_path / 'save.json'))
+    game.start_new_game('Easy', 9, seed=3)
+    yield game
+    game.shutdown()
+
+
+def empty_cells(game):
+    return [divmod(idx, game.size) for idx, value in enumerate(game.state.cells)
+            if not value]
+
+
+def snapshot(game):
+    return list(game.state.cells), list(game.notes), game.filled
+
+
+def play(game):
+    """A few notes and moves; the first move clears notes of its peers."""
+    (r1, c1), (r2, c2), (r3, c3) = empty_cells(game)[:3]
+    for row, col in ((r1, c1), (r2, c2), (r3, c3)):
+        for digit in game.candidates(row, col):
+            game.toggle_note(row, col, digit)
+    assert game.make_move(r1, c1, game.solution[r1, c1])
+    assert game.make_move(r3, c3, game.solution[r3, c3])
+
+
+def test_entries_are_packed(game):
+    (row, col), = empty_cells(game)[:1]
+    game.toggle_note(row, col, 4)
+    idx, word = game.history
+    assert idx == row * 9 + col
+    assert word == NOTE_FLAG | 4
+    game.toggle_note(row, col, 4)
+    assert game.history[-1] == NOTE_FLAG | 4 << 5
+    assert game.history.itemsize == 2
+
+
+def test_move_groups_the_notes_it_clears(game):
+    (row, col), = empty_cells(game)[:1]
+    digit = game.solution[row, col]
+    peer = next((r, c) for r, c in empty_cells(game)
+                if (r, c) != (row, col) and r == row
+                and digit in game.candidates(r, c))
+    game.toggle_note(*peer, digit)
+    before = snapshot(game)
+    game.make_move(row, col, digit)
+    assert game.history[-2] == peer[0] * 9 + peer[1]
+    assert game.history[-1] & GROUP_FLAG
+    assert game.note_changes == [peer[0] * 9 + peer[1]]
+    # One undo takes back the move and the cleared note together
+    game.undo()
+    assert snapshot(game) == before
+
+
+def test_undo_all_then_redo_all(game):
+    start = snapshot(game)
+    play(game)
+    end = snapshot(game)
+    while game.undo():
+        pass
+    assert snapshot(game) == start
+    assert not game.history
+    while game.redo():
+        pass
+    assert snapshot(game) == end
+    assert not game.redo_log
+
+
+def test_new_action_drops_redo(game):
+    play(game)
+    game.undo()
+    assert game.redo_log
+    row, col = empty_cells(game)[-1]
+    game.toggle_note(row, col, game.candidates(row, col)[0])
+    assert not game.redo_log
+
+
+def test_save_and_resume_replay_the_log(game):
+    play(game)
+    game.undo()
+    game.save()
+    resumed = SudokuGame()
+    resumed.storage = game.storage
+    try:
+        assert resumed.resume() is not None
+        assert snapshot(resumed) == snapshot(game)
+        assert resumed.history == game.history
+        assert resumed.redo_log == game.redo_log
+        resumed.redo()
+        game.redo()
+        assert snapshot(resumed) == snapshot(game)
+    finally:
+        resumed.shutdown()
+
+
+def test_winning_clears_the_save(game):
+    game.storage.save_game(game)
+    for idx, value in enumerate(game.state.cells):
+        if not value:
+            game.make_move(*divmod(idx, 9), game.solution.cells[idx])
+    assert game.check_completion()
+    assert not game.storage.has_save()
+
+
+def test_losing_clears_the_save(game):
+    game.storage.save_game(game)
+    row, col = empty_cells(game)[0]
+    wrong = next(d for d in range(1, 10) if d != game.solution[row, col])
+    game.toggle_note(row, col, wrong)
+    while not game.is_game_over():
+        assert not game.make_move(row, col, wrong)
+    assert not game.storage.has_save()
+    # Wrong entries leave the cell and its notes alone
+    assert game.value_at(row, col) == 0
+    assert game.notes_at(row, col) == [wrong]
@@ -0,0 +1,115 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from constants.settings import PUZZLE_POOL_RETRIES
+from game import pool as pool_module
+from game.board import Board
+from game.pool import PuzzlePool
+
+
+def wait_for(condition, timeout=60):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def threaded_pool():
+    # The refill bookkeeping with threads standing in for worker processes,
+    # so _generate can be replaced
+    pool = PuzzlePool(difficulties=('Easy',), size=2, workers=1)
+    pool.executor = ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_fills_and_refills():
+    pool = PuzzlePool(difficulties=('Easy',), size=2, workers=1)
+    try:
+        pool.start()
+        wait_for(lambda: len(pool.queues['Easy']) == 2)
+        puzzle, solution = pool.get('Easy')
+        assert isinstance(puzzle, Board) and isinstance(solution, Board)
+        # The taken puzzle is replaced in the background
+        wait_for(lambda: len(pool.queues['Easy']) == 2)
+        assert pool.pending['Easy'] == 0
+    finally:
+        pool.shutdown()
+    assert pool.get('Easy') is not None
+    assert pool.get('Hard') is None
+
+
+def test_get_before_start_is_empty():
+    pool = PuzzlePool(difficulties=('Easy',))
+    assert pool.get('Easy') is None
+    pool.shutdown()
+    pool.start()
+    assert pool.executor is None
+
+
+def test_failed_generation_is_replaced(threaded_pool, monkeypatch):
+    calls = []
+
+    def flaky(difficulty, backend):
+        calls.append(difficulty)
+        if len(calls) == 1:
+            raise RuntimeError("worker failed")
+        return len(calls)
+
+    monkeypatch.setattr(pool_module, '_generate', flaky)
+    threaded_pool._refill('Easy')
+    wait_for(lambda: len(threaded_pool.queues['Easy']) == 2)
+    assert len(calls) == 3
+    assert threaded_pool.failures['Easy'] == 0
+
+
+def test_failing_difficulty_stops_retrying(threaded_pool, monkeypatch):
+    calls = []
+
+    def broken(difficulty, backend):
+        calls.append(difficulty)
+        raise RuntimeError("worker failed")
+
+    monkeypatch.setattr(pool_module, '_generate', broken)
+    threaded_pool._refill('Easy')
+    wait_for(lambda: threaded_pool.pending['Easy'] == 0
+             and threaded_pool.failures['Easy'] > PUZZLE_POOL_RETRIES)
+    time.sleep(0.05)
+    # The two first attempts plus the retries, then no more
+    assert len(calls) == 2 + PUZZLE_POOL_RETRIES
+    assert not threaded_pool.queues['Easy']
+
+
+def test_instant_failures_stop_retrying(monkeypatch):
+    # Futures that are already done when their callback is added run it
+    # inside _refill
+    class InstantExecutor:
+        def submit(self, fn, *args):
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        def shutdown(self, **kwargs):
+            pass
+
+    calls = []
+
+    def broken(difficulty, backend):
+        calls.append(difficulty)
+        raise RuntimeError("worker failed")
+
+    monkeypatch.setattr(pool_module, '_generate', broken)
+    pool = PuzzlePool(difficulties=('Easy',), size=2, workers=1)
+    pool.executor = InstantExecutor()
+    pool._refill('Easy')
+    assert len(calls) == 1 + PUZZLE_POOL_RETRIES
+    assert pool.pending['Easy'] == 0
+    pool.get('Easy')
+    assert len(calls) == 1 + PUZZLE_POOL_RETRIES
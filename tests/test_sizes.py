@@ -0,0 +1,53 @@
+import pytest
+
+from constants.settings import DIFFICULTY_LEVELS, SIZE_DIFFICULTIES
+from game.generator import SudokuGenerator
+from game.solver import count_solutions, geometry
+from game.sudoku import SudokuGame
+
+
+def assert_valid_pair(puzzle, solution, size):
+    assert puzzle.size == solution.size == size
+    digits = set(range(1, size + 1))
+    for unit in geometry(size).units:
+        assert {solution.cells[idx] for idx in unit} == digits
+    assert all(not p or p == s for p, s in zip(puzzle.cells, solution.cells))
+    assert count_solutions(puzzle) == 1
+
+
+@pytest.mark.parametrize('size', [4, 16, 25])
+def test_seeded_boards_of_every_size(size):
+    difficulty = SIZE_DIFFICULTIES.get(size, tuple(DIFFICULTY_LEVELS))[-1]
+    puzzle, solution = SudokuGenerator().generate_puzzle(difficulty, size=size, seed=2)
+    assert_valid_pair(puzzle, solution, size)
+    assert puzzle.filled() < size * size
+
+
+def test_timed_large_board():
+    puzzle, solution = SudokuGenerator(seed=4).generate_puzzle('Medium', size=16)
+    assert_valid_pair(puzzle, solution, 16)
+
+
+def test_offered_large_board_difficulties_differ():
+    for size, offered in SIZE_DIFFICULTIES.items():
+        clues = [SudokuGenerator().generate_puzzle(d, size=size, seed=1)[0].filled()
+                 for d in offered]
+        assert clues == sorted(clues, reverse=True)
+        assert len(set(clues)) == len(clues)
+
+
+def test_game_plays_on_a_large_board():
+    game = SudokuGame()
+    try:
+        game.start_new_game('Easy', 16, seed=5)
+        assert game.size == 16
+        idx = game.puzzle.cells.index(0)
+        row, col = divmod(idx, 16)
+        digit = game.solution[row, col]
+        assert digit in game.candidates(row, col)
+        wrong = next(d for d in range(1, 17) if d != digit)
+        assert not game.make_move(row, col, wrong)
+        assert game.make_move(row, col, digit)
+        assert game.value_at(row, col) == digit
+    finally:
+        game.shutdown()
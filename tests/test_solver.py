@@ -0,0 +1,61 @@
+import pytest
+
+from game import solver
+from game.solver import SolverState, geometry, mask_digits
+from .corpora import load
+
+
+def open_grid():
+    # An easy puzzle with its first two rows blanked has many solutions
+    puzzle = load('easy.txt', 1)[0]
+    puzzle.cells[:18] = bytes(18)
+    return puzzle
+
+
+def assert_solves(puzzle, rows):
+    cells = [value for row in rows for value in row]
+    assert all(not p or p == s for p, s in zip(puzzle.cells, cells))
+    for unit in geometry(puzzle.size).units:
+        assert sorted(cells[idx] for idx in unit) == list(range(1, puzzle.size + 1))
+
+
+@pytest.mark.parametrize('puzzle', load('hard.txt', 5) + load('17clue.txt', 5))
+def test_corpus_puzzles_are_unique(puzzle):
+    assert solver.count_solutions(puzzle) == 1
+    assert_solves(puzzle, solver.solve(puzzle))
+
+
+def test_open_grid_has_many_solutions():
+    puzzle = open_grid()
+    assert solver.count_solutions(puzzle, limit=5) == 5
+    solutions = list(solver.iter_solutions(puzzle))
+    assert len(solutions) > 5 and len(set(map(str, solutions))) == len(solutions)
+    for rows in solutions[:5]:
+        assert_solves(puzzle, rows)
+
+
+def test_contradiction_has_no_solution():
+    puzzle = load('easy.txt', 1)[0]
+    row = puzzle.to_rows()[0]
+    empty = row.index(0)
+    puzzle[0, empty] = next(d for d in row if d)
+    assert solver.solve(puzzle) is None
+    assert solver.count_solutions(puzzle) == 0
+
+
+def test_state_masks_follow_place_and_remove():
+    state = SolverState.from_grid(load('easy.txt', 1)[0])
+    idx = state.cells.index(0)
+    digits = mask_digits(state.candidates(idx))
+    state.place(idx, digits[0])
+    assert not state.candidates(idx) & 1 << (digits[0] - 1)
+    peer = next(i for i in state.geo.peers[idx] if not state.cells[i])
+    assert digits[0] not in mask_digits(state.candidates(peer))
+    state.remove(idx)
+    assert mask_digits(state.candidates(idx)) == digits
+
+
+def test_search_counts_nodes():
+    stats = {}
+    solver.solve(load('hard.txt', 1)[0], stats=stats)
+    assert stats['nodes'] > 0
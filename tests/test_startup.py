@@ -0,0 +1,28 @@
+import threading
+
+import main
+from game.pool import PuzzlePool
+from game.sudoku import SudokuGame
+
+
+def test_warm_up_starts_the_pool_off_the_calling_thread(tmp_path, monkeypatch):
+    # No puzzle bank in the working directory, so the pool is used
+    monkeypatch.chdir(tmp_path)
+    started = threading.Event()
+    threads = []
+
+    def start(pool):
+        threads.append(threading.current_thread())
+        started.set()
+
+    monkeypatch.setattr(PuzzlePool, 'start', start)
+    game = SudokuGame()
+    try:
+        main.warm_up(game)
+        # The pool is in place as soon as warm_up returns, so a game started
+        # next sees it, but its workers are started elsewhere
+        assert isinstance(game.pool, PuzzlePool)
+        assert started.wait(10)
+        assert threads[0] is not threading.current_thread()
+    finally:
+        game.shutdown()
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from game.board import Board
+from game.generator import SudokuGenerator
+from game.grader import grade, rate
+from game.seeds import SEEDS
+from game.solver import count_solutions, geometry, solve
+from game.transforms import apply_transform, random_transform, transform_pair
+from .corpora import load
+
+
+def assert_valid_solution(board):
+    digits = set(range(1, board.size + 1))
+    for unit in geometry(board.size).units:
+        assert {board.cells[idx] for idx in unit} == digits
+
+
+@pytest.mark.parametrize('puzzle', load('easy.txt', 3) + load('hard.txt', 3))
+def test_transforms_keep_uniqueness_and_grade(puzzle):
+    solution = Board.from_rows(solve(puzzle))
+    rng = random.Random(puzzle.to_string())
+    for _ in range(5):
+        new_puzzle, new_solution = transform_pair(puzzle, solution, rng)
+        assert new_puzzle.filled() == puzzle.filled()
+        assert count_solutions(new_puzzle) == 1
+        assert solve(new_puzzle) == new_solution.to_rows()
+        assert_valid_solution(new_solution)
+        assert rate(new_puzzle) == rate(puzzle)
+
+
+def test_transform_covers_transposition_and_relabelling():
+    rng = random.Random(0)
+    transforms = [random_transform(rng) for _ in range(50)]
+    assert {t[3] for t in transforms} == {True, False}
+    for rows, cols, digits, _ in transforms:
+        assert sorted(rows) == sorted(cols) == list(range(9))
+        assert digits[0] == 0 and sorted(digits[1:]) == list(range(1, 10))
+
+
+def test_identity_transform():
+    puzzle = load('easy.txt', 1)[0]
+    identity = (list(range(9)), list(range(9)), list(range(10)), False)
+    assert apply_transform(puzzle, identity) == puzzle
+    transposed = apply_transform(puzzle, identity[:3] + (True,))
+    assert transposed.to_rows() == [list(col) for col in zip(*puzzle.to_rows())]
+
+
+def test_large_board_transform_stays_valid():
+    _, solution = SudokuGenerator().generate_puzzle('Easy', size=16, seed=1)
+    moved = apply_transform(solution, random_transform(random.Random(1), 16))
+    assert_valid_solution(moved)
+
+
+@pytest.mark.parametrize('difficulty', list(SEEDS))
+def test_transform_mode_matches_its_difficulty(difficulty):
+    generator = SudokuGenerator(seed=3)
+    puzzle, solution = generator.generate_puzzle(difficulty, mode='transform')
+    assert count_solutions(puzzle) == 1
+    assert solve(puzzle) == solution.to_rows()
+    assert grade(puzzle) == difficulty
+
+
+def test_transform_mode_is_9x9_only():
+    with pytest.raises(ValueError):
+        SudokuGenerator().generate_puzzle('Easy', mode='transform', size=16)
@@ -0,0 +1,56 @@
+import math
+
+
+class LatencyHistogram:
+    """
+    Fixed-size histogram of durations in seconds. Buckets grow
+    geometrically, so percentiles are accurate to within `growth` (5% by
+    default) and memory does not depend on how many samples are added.
+    """
+
+    def __init__(self, smallest=1e-6, largest=100.0, growth=1.05):
+        self.smallest = smallest
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.buckets = [0] * (self._bucket(largest) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, seconds):
+        if seconds <= self.smallest:
+            return 0
+        return int(math.log(seconds / self.smallest) / self._log_growth) + 1
+
+    def add(self, seconds):
+        self.buckets[min(self._bucket(seconds), len(self.buckets) - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def update(self, samples):
+        for seconds in samples:
+            self.add(seconds)
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(self.smallest * self.growth ** i, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
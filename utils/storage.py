@@ -1,6 +1,8 @@
 import json
 import os
 
+from game.board import Board
+
 class GameStorage:
     def __init__(self, save_file="game_save.json"):
         self.save_file = save_file
@@ -9,11 +11,18 @@ class GameStorage:
         """
         Save the current game state to a file
         """
+        # Boards are stored in their one-character-per-cell string form
         data = {
-            'puzzle': game_state.puzzle,
-            'solution': game_state.solution,
+            'puzzle': game_state.puzzle.to_string(),
+            'solution': game_state.solution.to_string(),
             'difficulty': game_state.current_difficulty,
-            'elapsed_time': game_state.timer.elapsed_time
+            'size': game_state.size,
+            'seed': game_state.seed,
+            'lives': game_state.lives,
+            # Move log as plain numbers; replaying it restores the board
+            'history': game_state.history.tolist(),
+            'redo': game_state.redo_log.tolist(),
+            'elapsed_time': game_state.timer.get_elapsed()
         }
         
         with open(self.save_file, 'w') as f:
@@ -21,7 +30,7 @@ class GameStorage:
             
     def load_game(self):
         """
-        Load a saved game state from file
+        Load a saved game state from file, with puzzle and solution as Boards
         Returns None if no save file exists
         """
         if not os.path.exists(self.save_file):
@@ -30,10 +39,15 @@ class GameStorage:
         try:
             with open(self.save_file, 'r') as f:
                 data = json.load(f)
+            data['puzzle'] = Board.from_string(data['puzzle'])
+            data['solution'] = Board.from_string(data['solution'])
             return data
         except:
             return None
             
+    def has_save(self):
+        return os.path.exists(self.save_file)
+            
     def clear_save(self):
         """
         Delete the save file if it exists
@@ -6,8 +6,9 @@ class Timer:
         self.elapsed_time = 0
         self.running = False
         
-    def start(self):
-        self.start_time = time.time()
+    def start(self, elapsed=0):
+        # elapsed carries over time from a resumed game
+        self.start_time = time.time() - elapsed
         self.running = True
         
     def stop(self):
@@ -15,6 +16,11 @@ class Timer:
             self.elapsed_time = time.time() - self.start_time
             self.running = False
         
+    def get_elapsed(self):
+        if self.running:
+            return time.time() - self.start_time
+        return self.elapsed_time
+        
     def get_time_string(self):
         if not self.running:
             return "00:00"